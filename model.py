@@ -8,6 +8,7 @@ import threading
 import os
 import sys
 import copy
+import functools
 
 
 class RawDataManager:
@@ -215,6 +216,36 @@ class RawDataManager:
                 self._overrides[file_path][field] = value
             self._notify()
 
+    def set_override_bulk(self, field: str, value: str, file_paths: Optional[List[str]] = None):
+        """
+        Enregistre la même correction pour plusieurs fichiers en une seule passe.
+        Mêmes règles que set_override, mais une seule notification est émise.
+
+        Args:
+            field: Champ éditable à corriger.
+            value: Valeur corrigée.
+            file_paths: Fichiers concernés ; tous les fichiers si None.
+        """
+        if field not in self.EDITABLE_FIELDS:
+            return
+        with self._lock:
+            targets = self._insertion_order if file_paths is None else file_paths
+            changed = False
+            for file_path in targets:
+                if file_path not in self._files:
+                    continue
+                original = self._files[file_path].get(field, "")
+                if value == original:
+                    if file_path in self._overrides:
+                        self._overrides[file_path].pop(field, None)
+                        if not self._overrides[file_path]:
+                            del self._overrides[file_path]
+                else:
+                    self._overrides.setdefault(file_path, {})[field] = value
+                changed = True
+            if changed:
+                self._notify()
+
     def get_effective_value(self, file_path: str, field: str) -> str:
         """Retourne la valeur corrigée si elle existe, sinon la valeur terrain."""
         with self._lock:
@@ -248,6 +279,24 @@ class RawDataManager:
         with self._lock:
             return dict(self._overrides.get(file_path, {}))
 
+    def get_overrides_snapshot(self, file_path: str) -> Dict[str, tuple]:
+        """
+        Retourne les corrections d'un fichier avec leur valeur terrain, en un seul accès.
+
+        Returns:
+            Dict {field: (valeur_originale, valeur_corrigée)}, dans l'ordre de EDITABLE_FIELDS.
+        """
+        with self._lock:
+            overrides = self._overrides.get(file_path)
+            if not overrides:
+                return {}
+            original = self._files.get(file_path, {})
+            return {
+                field: (original.get(field, ""), overrides[field])
+                for field in self.EDITABLE_FIELDS
+                if field in overrides
+            }
+
     def reset_overrides(self, file_path: str):
         """Rétablit toutes les données terrain pour un fichier (supprime toutes les corrections)."""
         with self._lock:
@@ -288,8 +337,13 @@ class RawDataManager:
                 return self._files[file_path].get(field, defaults.get(field, ""))
             return defaults.get(field, "")
 
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path):
-    """Obtient le chemin vers les ressources, que ce soit en dev ou en exe."""
+    """Obtient le chemin vers les ressources, que ce soit en dev ou en exe.
+
+    Le résultat est mis en cache : la base (bundle PyInstaller ou dossier
+    de lancement) ne change pas pendant l'exécution.
+    """
     try:
         # PyInstaller crée un dossier temporaire et y place le bundle
         base_path = sys._MEIPASS
@@ -387,6 +441,8 @@ class AppModel:
 
         # NOUVEAU : Queue thread-safe pour les mises à jour GUI
         self.gui_update_queue = queue.Queue()
+        # Callbacks appelés (depuis le thread producteur) à chaque mise à jour postée
+        self._gui_update_callbacks: List[Callable] = []
 
         # Gestionnaire de réglages persistants
         self.settings_manager = SettingsManager()
@@ -440,9 +496,9 @@ class AppModel:
             self.initialize_indexer()
         if not self.cpt_indexer:
             # Aucun répertoire configuré, signaler sans erreur
-            self.gui_update_queue.put(("indexing_error",
+            self._post_gui_update("indexing_error",
                 "Aucun répertoire d'essais configuré. "
-                "Veuillez définir un emplacement dans les Préférences."))
+                "Veuillez définir un emplacement dans les Préférences.")
             return
 
         def progress_callback(current, total):
@@ -450,11 +506,11 @@ class AppModel:
             if total > 0:
                 percentage = (current / total) * 100
                 self.indexing_status["progress"] = percentage
-                self.gui_update_queue.put(("indexing_progress", {
+                self._post_gui_update("indexing_progress", {
                     "current": current,
                     "total": total,
                     "percentage": percentage
-                }))
+                })
 
         def indexing_thread():
             self.indexing_status["is_indexing"] = True
@@ -472,23 +528,48 @@ class AppModel:
                 self.last_indexing_completed = datetime.now()
 
                 # Mettre le résultat dans la queue
-                self.gui_update_queue.put(("indexing_completed", result))
+                self._post_gui_update("indexing_completed", result)
                 
             except Exception as e:
                 self.indexing_status["is_indexing"] = False
                 self.indexing_status["status"] = "error"
                 self.indexing_status["error"] = str(e)
-                self.gui_update_queue.put(("indexing_error", str(e)))
+                self._post_gui_update("indexing_error", str(e))
                 print(f"Erreur lors de l'indexation : {e}")
 
         thread = threading.Thread(target=indexing_thread, daemon=True)
         thread.start()
 
-    def get_gui_updates(self):
-        """Récupère les mises à jour en attente pour la GUI."""
+    def register_gui_callback(self, callback: Callable):
+        """
+        Enregistre un callback appelé à chaque mise à jour GUI postée.
+
+        Le callback est invoqué depuis le thread producteur, sans argument :
+        il doit seulement planifier la lecture de get_gui_updates() dans le
+        thread principal.
+        """
+        if callback not in self._gui_update_callbacks:
+            self._gui_update_callbacks.append(callback)
+
+    def _post_gui_update(self, update_type: str, data):
+        """Place une mise à jour dans la queue GUI et réveille les abonnés."""
+        self.gui_update_queue.put((update_type, data))
+        for cb in list(self._gui_update_callbacks):
+            try:
+                cb()
+            except Exception as e:
+                print(f"AppModel: erreur dans callback de mise à jour GUI: {e}")
+
+    def get_gui_updates(self, max_items: Optional[int] = None):
+        """
+        Récupère les mises à jour en attente pour la GUI.
+
+        Si ``max_items`` est fourni, au plus ce nombre de mises à jour est
+        retiré de la queue ; le reste attend l'appel suivant.
+        """
         updates = []
         try:
-            while True:
+            while max_items is None or len(updates) < max_items:
                 update = self.gui_update_queue.get_nowait()
                 updates.append(update)
         except queue.Empty:
@@ -30,7 +30,7 @@ class AppPresenter:
             # qui n'en fait pas partie (PREFERENCES, RECHERCHE RAPIDE)
             segmented_values = ["DONNÉES BRUTES", "FILTRER", "OBSERVATIONS", "COTES", "EXTRACTIONS", "CALCULER"]
             if workspace_name not in segmented_values:
-                if hasattr(self.view, "top_menu_view"):
+                if self.view.top_menu_view is not None:
                     self.view.top_menu_view.deselect_all()
         else:
             print(f"Erreur: Workspace '{workspace_name}' introuvable")
@@ -46,7 +46,7 @@ class AppPresenter:
                 self.model.start_background_indexing()
 
         # Propager le changement de reglages a la vue FILTRER
-        if hasattr(self.view, 'cleaning_view'):
+        if self.view.cleaning_view is not None:
             self.view.cleaning_view.on_settings_changed()
 
     def on_search_text_changed(self, search_text):
@@ -66,20 +66,20 @@ class AppPresenter:
             print(f"DEBUG PRESENTER: {len(results)} résultats trouvés")
             
             # SÉCURISÉ : Planifier la mise à jour GUI dans le thread principal
-            if hasattr(self.view, 'quick_search_zone'):
+            if self.view.quick_search_zone is not None:
                 self.view.schedule_gui_update(
                     lambda: self.view.quick_search_zone.display_search_results(results)
                 )
         elif search_text.strip() == "":
             # Afficher les premiers résultats si recherche vide
             results = self.model.search_cpt_files("")
-            if hasattr(self.view, 'quick_search_zone'):
+            if self.view.quick_search_zone is not None:
                 self.view.schedule_gui_update(
                     lambda: self.view.quick_search_zone.display_search_results(results[:10])
                 )
         else:
             # Effacer les résultats si recherche trop courte
-            if hasattr(self.view, 'quick_search_zone'):
+            if self.view.quick_search_zone is not None:
                 self.view.schedule_gui_update(
                     lambda: self.view.quick_search_zone.clear_search_results()
                 )
@@ -89,7 +89,7 @@ class AppPresenter:
         search_text = self.model.get_search_text()
         if search_text.strip():
             results = self.model.search_cpt_files(search_text)
-            if hasattr(self.view, 'quick_search_zone'):
+            if self.view.quick_search_zone is not None:
                 self.view.schedule_gui_update(
                     lambda: self.view.quick_search_zone.display_search_results(results)
                 )
@@ -159,7 +159,7 @@ class AppPresenter:
 
     def _show_toast(self, message):
         """Affiche un toast de confirmation via la vue."""
-        if hasattr(self.view, "quick_search_zone"):
+        if self.view.quick_search_zone is not None:
             self.view.schedule_gui_update(
                 lambda: self.view.quick_search_zone.show_toast(message)
             )
@@ -206,13 +206,15 @@ class AppPresenter:
 
     def _handle_material_settings(self):
         """Ouvre la modale de sélection du matériel pour tous les essais."""
-        if hasattr(self.view, 'traiter_view'):
-            self.view.traiter_view.show_equipment_modal()
+        traiter_view = self.view.get_view("traiter_view")
+        if traiter_view is not None:
+            traiter_view.show_equipment_modal()
 
     def _handle_date_settings(self):
         """Ouvre un sélecteur de date et applique la date choisie aux essais sélectionnés."""
-        if hasattr(self.view, 'raw_data_view'):
-            self.view.raw_data_view.show_date_picker()
+        raw_data_view = self.view.get_view("raw_data_view")
+        if raw_data_view is not None:
+            raw_data_view.show_date_picker()
 
     def _handle_manometer_settings(self):
         """Gère les réglages des manomètres."""
@@ -0,0 +1,75 @@
+"""Menu contextuel du workspace « Données Brutes » : fermeture et libération du grab."""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ctk = pytest.importorskip("customtkinter")
+pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+import tkinter as tk
+
+from model import RawDataManager
+from view import RawDataWorkspaceView
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    try:
+        root = ctk.CTk()
+    except tk.TclError:
+        pytest.skip("Aucun affichage disponible pour Tk")
+    root.geometry("900x600")
+
+    gef_path = tmp_path / "CPT01.GEF"
+    gef_path.write_text("#GEFID= 1, 1, 0\n")
+    rdm = RawDataManager()
+    rdm.add_file({"file_path": str(gef_path), "file_name": "CPT01.GEF",
+                  "Job Number": "J1", "Date": "01/01/2024", "Location": "Lyon"})
+
+    view = RawDataWorkspaceView(root, SimpleNamespace(raw_data_manager=rdm), None)
+    view.pack(fill="both", expand=True)
+    view._refresh_display()
+    root.update()
+    yield root, view, str(gef_path)
+    root.destroy()
+
+
+def _open_menu(root, view, item):
+    x, y, w, h = view.tree.bbox(item)
+    before = set(root.winfo_children())
+    event = SimpleNamespace(x=x + 5, y=y + h // 2,
+                            x_root=view.tree.winfo_rootx() + x + 5,
+                            y_root=view.tree.winfo_rooty() + y + h // 2)
+    view._on_right_click(event)
+    root.update()
+    (menu,) = set(root.winfo_children()) - before
+    return menu
+
+
+def test_click_outside_closes_menu_and_releases_grab(workspace):
+    root, view, item = workspace
+    menu = _open_menu(root, view, item)
+    assert root.grab_current() is not None
+
+    # Clic hors du menu : le grab le redirige vers la fenêtre Tk du frame
+    menu.event_generate("<Button-1>", x=-10, y=-10)
+    root.update()
+
+    assert not menu.winfo_exists()
+    assert root.grab_current() is None
+
+
+def test_escape_closes_menu_and_releases_grab(workspace):
+    root, view, item = workspace
+    menu = _open_menu(root, view, item)
+
+    menu.event_generate("<Escape>")
+    root.update()
+
+    assert not menu.winfo_exists()
+    assert root.grab_current() is None
@@ -1215,17 +1215,17 @@ class TraiterView(ctk.CTkFrame):
 
         Permet au module de rapport d'acceder aux donnees filtrees.
         """
-        view = self.winfo_toplevel()
-        if hasattr(view, "cleaning_view"):
-            entries = getattr(view.cleaning_view, "cpt_entries", [])
+        cleaning_view = getattr(self.winfo_toplevel(), "cleaning_view", None)
+        if cleaning_view is not None:
+            entries = getattr(cleaning_view, "cpt_entries", [])
             return {e.file_path: e for e in entries}
         return {}
 
     def _get_cotes_map(self) -> Dict[str, float]:
         """Recupere le mapping {file_path: cote_de_depart} depuis la vue Cotes."""
-        view = self.winfo_toplevel()
-        if hasattr(view, "cotes_view"):
-            return {fp: v for fp, v in view.cotes_view.get_all_cotes().items()
+        cotes_view = getattr(self.winfo_toplevel(), "cotes_view", None)
+        if cotes_view is not None:
+            return {fp: v for fp, v in cotes_view.get_all_cotes().items()
                     if v is not None}
         return {}
 
@@ -1235,9 +1235,9 @@ class TraiterView(ctk.CTkFrame):
         Chaque store_dict contient les niveaux d'eau et annotations saisis
         par l'utilisateur.
         """
-        view = self.winfo_toplevel()
-        if hasattr(view, "observations_view"):
-            return dict(view.observations_view._data_store)
+        observations_view = getattr(self.winfo_toplevel(), "observations_view", None)
+        if observations_view is not None:
+            return dict(observations_view._data_store)
         return {}
 
     def _on_generate_report(self):
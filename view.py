@@ -1,9 +1,24 @@
+import concurrent.futures
 import customtkinter as ctk
+from collections import Counter, OrderedDict
+import numpy as np
 from tkinter import ttk
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
+import datetime
+import functools
+import logging
+import math
+from operator import itemgetter
 import os
+import queue
+import re
 import tkinter as tk
 import threading
+import time
+try:
+    from tkcalendar import Calendar
+except ImportError:
+    Calendar = None
 from model import get_resource_path
 from settings_view import SettingsView
 from cpt_cleaning_view import CPTCleaningView, CPTFileEntry
@@ -14,6 +29,45 @@ from traiter_view import TraiterView
 from home_view import HomeView
 
 
+logger = logging.getLogger(__name__)
+
+# Préfixe affiché devant les valeurs corrigées par l'utilisateur
+_OV_PREFIX = "\u270E "
+
+# Séparateurs entre noms d'opérateurs (espace, / ou -)
+_OPERATOR_SPLIT_RE = re.compile(r'[\s/\-]+')
+_ESSAI_RE = re.compile(r'\d+')
+
+# Tags des lignes du Treeview de recherche, partagés par toutes les lignes
+_EVEN_TAGS = ('evenrow',)
+_ODD_TAGS = ('oddrow',)
+_IN_RAW_DATA_TAGS = ('in_raw_data',)
+# Début du texte des lignes de statut (recherche, aucun résultat, indexation)
+_SPECIAL_PREFIXES = ('🔍 Recherche', 'Aucun résultat', 'Indexation')
+
+
+@functools.lru_cache(maxsize=32)
+def _hex_to_rgb(hex_color):
+    """Convertit une couleur hexadécimale en tuple RGB (résultat mis en cache)."""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_result_date(date_str):
+    """Convertit la date d'un résultat de recherche en datetime (None si non reconnue).
+
+    Mise en cache par chaîne : changer de mode d'affichage ou re-trier ne
+    reparse pas les dates déjà vues.
+    """
+    for fmt in ('%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y'):
+        try:
+            return datetime.datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 class TopMenuView(ctk.CTkFrame):
     """
     Gère la barre de menu supérieure, incluant le bouton dossier et les boutons segmentés.
@@ -87,6 +141,9 @@ class SideMenuView(ctk.CTkFrame):
     """
     Gère le panneau latéral, incluant les boutons de réglages et les toolboxes.
     """
+    # Icônes déjà chargées, partagées entre toolboxes : chemin -> CTkImage (ou None)
+    _icon_cache = {}
+
     def __init__(self, parent, model, presenter, *args, **kwargs):
         super().__init__(parent, width=model.side_panel_width, fg_color=model.side_panel_color, corner_radius=0, *args, **kwargs)
         self.model = model
@@ -96,6 +153,10 @@ class SideMenuView(ctk.CTkFrame):
         self.pack(side="left", fill="y")
         self.pack_propagate(False)
 
+        # Icônes décodées en arrière-plan pendant la construction des boutons
+        self._icon_queue = queue.Queue()
+        self._icon_buttons = {}  # Chemin d'icône -> boutons en attente de cette icône
+
         # Création des toolboxes
         self._create_toolboxes()
 
@@ -109,6 +170,21 @@ class SideMenuView(ctk.CTkFrame):
     def _create_toolboxes(self):
         """Crée dynamiquement toutes les toolboxes du panneau latéral."""
         toolbox_data = self.model.get_toolbox_data()
+
+        # Lancer le décodage des icônes pas encore en cache dans un thread ;
+        # les CTkImage sont créées ensuite dans le thread Tk
+        icon_paths = {
+            get_resource_path(item["icon"])
+            for toolbox_config in toolbox_data.values()
+            for item in toolbox_config["items"]
+            if item.get("icon")
+        }
+        missing_paths = [path for path in icon_paths if path not in self._icon_cache]
+        if missing_paths:
+            threading.Thread(
+                target=self._prefetch_icons, args=(missing_paths,), daemon=True
+            ).start()
+            self.after(10, self._drain_icon_queue)
         
         # Stocker les références des toolboxes créées
         self.toolboxes = {}
@@ -163,15 +239,8 @@ class SideMenuView(ctk.CTkFrame):
             button_title = item.get("title", "")
             action = item.get("action")
 
-            # Charger l'icône si elle existe
-            icon_image = None
-            if icon_path and os.path.exists(icon_path):
-                try:
-                    img = Image.open(icon_path)
-                    img = img.resize((20, 20), Image.Resampling.LANCZOS)
-                    icon_image = ctk.CTkImage(light_image=img, dark_image=img, size=(20, 20))
-                except Exception as e:
-                    print(f"Erreur lors du chargement de l'icône {icon_path}: {e}")
+            # Icône déjà chargée, sinon posée à l'arrivée du thread de décodage
+            icon_image = self._icon_cache.get(icon_path) if icon_path else None
 
             # Créer le bouton avec style personnalisé
             btn = ctk.CTkButton(
@@ -190,9 +259,64 @@ class SideMenuView(ctk.CTkFrame):
                 command=lambda a=action: self.presenter.on_toolbox_action(a) if self.presenter else None
             )
             btn.pack(fill="x", pady=1)
+            if icon_path and icon_path not in self._icon_cache:
+                self._icon_buttons.setdefault(icon_path, []).append(btn)
 
         return toolbox_frame
 
+    def _prefetch_icons(self, icon_paths):
+        """Décode et redimensionne les icônes (thread de fond, sans objet Tk)."""
+        # Un seul listage par dossier d'icônes plutôt qu'un stat() par fichier
+        # (normcase : même tolérance à la casse que os.path.exists sous Windows)
+        dir_listings = {}
+        for icon_path in icon_paths:
+            icon_dir = os.path.dirname(icon_path)
+            if icon_dir not in dir_listings:
+                try:
+                    dir_listings[icon_dir] = {
+                        os.path.normcase(entry.name)
+                        for entry in os.scandir(icon_dir or ".") if entry.is_file()
+                    }
+                except OSError:
+                    dir_listings[icon_dir] = set()
+
+        for icon_path in icon_paths:
+            img = None
+            file_name = os.path.normcase(os.path.basename(icon_path))
+            if file_name in dir_listings[os.path.dirname(icon_path)]:
+                try:
+                    img = Image.open(icon_path)
+                    # JPEG : décodage directement à taille réduite (sans effet sur les PNG)
+                    img.draft("RGB", (20, 20))
+                    img = img.resize((20, 20), Image.Resampling.LANCZOS)
+                except Exception as e:
+                    print(f"Erreur lors du chargement de l'icône {icon_path}: {e}")
+                    img = None
+            self._icon_queue.put((icon_path, img))
+        self._icon_queue.put(None)  # Fin du décodage
+
+    def _drain_icon_queue(self):
+        """Crée les CTkImage des icônes décodées et les pose sur leurs boutons."""
+        while True:
+            try:
+                item = self._icon_queue.get_nowait()
+            except queue.Empty:
+                self.after(10, self._drain_icon_queue)
+                return
+            if item is None:
+                return
+
+            icon_path, img = item
+            icon_image = None
+            if img is not None:
+                icon_image = ctk.CTkImage(light_image=img, dark_image=img, size=(20, 20))
+            # Cache partagé entre toolboxes (None si fichier absent ou illisible)
+            self._icon_cache[icon_path] = icon_image
+            buttons = self._icon_buttons.pop(icon_path, [])
+            if icon_image is not None:
+                for btn in buttons:
+                    btn.configure(image=icon_image)
+
     def create_side_menu_button(self, text, command, relx, rely, **kwargs):
         """Crée un bouton pour le menu latéral."""
         defaults = {
@@ -226,11 +350,36 @@ class SideMenuView(ctk.CTkFrame):
         return button
 
 
+class _GroupBucket:
+    """Agrégats d'un groupe de résultats, mis à jour ligne par ligne."""
+    __slots__ = ("count", "counts", "oldest", "newest", "operators")
+
+    def __init__(self):
+        self.count = 0
+        self.counts = Counter()
+        self.oldest = None
+        self.newest = None
+        self.operators = set()
+
+
 class FileSearchZoneView(ctk.CTkFrame):
     """
     Classe dédiée à la zone de recherche de fichiers avec différents modes d'affichage.
     Gère l'interface de recherche et l'affichage des résultats pour le workspace "RECHERCHE RAPIDE".
     """
+    # Icône de recherche, chargée une seule fois pour toutes les instances
+    _search_icon_image = None
+
+    # Mapper les clés de colonnes aux clés de données
+    _SORT_KEY_MAPPING = {
+        "#0": "file_name",
+        "dossier": "Job Number",
+        "essai": "TestNumber",
+        "lieu": "Location",
+        "date": "Date",
+        "operateur": "Operator"
+    }
+
     def __init__(self, parent, model, presenter, *args, **kwargs):
         super().__init__(parent, fg_color="transparent", corner_radius=0, *args, **kwargs)
         self.model = model
@@ -239,10 +388,19 @@ class FileSearchZoneView(ctk.CTkFrame):
         # Attributs pour le debounce
         self.search_delay = 600  # 0.6 seconde en millisecondes
         self.search_after_id = None
+        self._last_query = None  # Dernière requête programmée ("" = résultats effacés)
         
         # Variables pour le tri
         self.sort_reverse = {}
         self.current_results = []  # Stocker les résultats actuels pour le tri
+        # Révision des résultats (nouvelle recherche ou nouveau tri) et révision
+        # déjà affichée par chaque mode : un changement de mode sans nouveaux
+        # résultats ne reconstruit rien
+        self._results_revision = 0
+        self._rendered_revision = {}
+        self._results_by_filename = {}  # Nom de fichier -> résultat (index de current_results)
+        self._selected_items = set()  # Items portant le tag 'selected'
+        self._context_menu = None  # Menu contextuel affiché (CTkFrame popup)
         
         # Variable pour suivre l'item survolé
         self.hovered_item = None
@@ -252,6 +410,13 @@ class FileSearchZoneView(ctk.CTkFrame):
         
         # Variable pour le mode d'affichage actuel
         self.current_display_mode = "list"  # "list", "group_by_date", "group_by_folder", "group_by_location"
+        self._pending_refresh = None  # Rafraîchissement regroupé en attente (after_idle)
+
+        # Zones groupées, construites au premier passage dans leur mode
+        self.group_by_date_frame = None
+        self.group_by_folder_frame = None
+        self.group_by_location_frame = None
+        self._cards_used_cols = {}  # Conteneur de cartes -> nb de colonnes configurées
         
         # Configuration des colonnes
         self.columns_config = [
@@ -272,27 +437,8 @@ class FileSearchZoneView(ctk.CTkFrame):
         # Rafraîchir le treeview quand les données brutes changent
         self.model.raw_data_manager.subscribe(self._on_raw_data_changed)
 
-        self.after(2000, self._check_indexing_status)
-
-    def _check_indexing_status(self):
-        """Vérifie et corrige l'état de l'indexation si nécessaire."""
-        print("DEBUG VUE: Vérification automatique de l'état d'indexation...")
-        
-        if not self.indexing_completed:
-            try:
-                # Test si on peut faire une recherche
-                test_results = self.model.search_cpt_files("")
-                print(f"DEBUG VUE: Test de recherche retourne {len(test_results)} résultats")
-                
-                if len(test_results) > 0:
-                    print("DEBUG VUE: CORRECTION - L'indexation est terminée mais le flag était à False")
-                    self.indexing_completed = True
-                    self.results_count_label.configure(
-                        text="✅ Prêt à chercher", 
-                        text_color="#28a745"
-                    )
-            except Exception as e:
-                print(f"DEBUG VUE: Erreur lors de la vérification automatique : {e}")
+        # La fin d'indexation est notifiée par AppView (événement
+        # "indexing_completed" du modèle) via on_indexing_completed.
 
     def _create_search_interface(self):
         """Crée tous les éléments de l'interface de recherche avec différents modes d'affichage."""
@@ -358,18 +504,11 @@ class FileSearchZoneView(ctk.CTkFrame):
         self.main_display_frame.grid_rowconfigure(0, weight=1)
         self.main_display_frame.grid_columnconfigure(0, weight=1)
 
-        # 1. Zone d'affichage liste (mode par défaut - Treeview actuel)
+        # Zone d'affichage liste (mode par défaut - Treeview actuel). Les zones
+        # groupées (date, dossier, localité) sont créées à la demande par
+        # _switch_display_mode.
         self._create_list_display_zone()
 
-        # 2. Zone d'affichage groupé par date
-        self._create_group_by_date_zone()
-
-        # 3. Zone d'affichage groupé par n° de dossier
-        self._create_group_by_folder_zone()
-
-        # 4. Zone d'affichage groupé par localité
-        self._create_group_by_location_zone()
-
         # Afficher le mode par défaut (liste)
         self._switch_display_mode("list")
 
@@ -377,6 +516,8 @@ class FileSearchZoneView(ctk.CTkFrame):
         """Crée la zone d'affichage en mode liste (Treeview)."""
         # Frame pour le mode liste
         self.list_display_frame = ctk.CTkFrame(self.main_display_frame, fg_color="transparent")
+        self.list_display_frame.grid(row=0, column=0, sticky="nsew")
+        self.list_display_frame.grid_remove()  # Options de grid conservées pour les réaffichages
         
         # Frame pour les en-têtes
         self.list_headers_frame = ctk.CTkFrame(self.list_display_frame, fg_color="transparent")
@@ -400,6 +541,8 @@ class FileSearchZoneView(ctk.CTkFrame):
     def _create_group_by_date_zone(self):
         """Crée la zone d'affichage groupé par date."""
         self.group_by_date_frame = ctk.CTkFrame(self.main_display_frame, fg_color="white")
+        self.group_by_date_frame.grid(row=0, column=0, sticky="nsew")
+        self.group_by_date_frame.grid_remove()  # Options de grid conservées pour les réaffichages
         
         # Titre de la zone
         title_label = ctk.CTkLabel(
@@ -429,6 +572,8 @@ class FileSearchZoneView(ctk.CTkFrame):
     def _create_group_by_folder_zone(self):
         """Crée la zone d'affichage groupé par n° de dossier."""
         self.group_by_folder_frame = ctk.CTkFrame(self.main_display_frame, fg_color="transparent")
+        self.group_by_folder_frame.grid(row=0, column=0, sticky="nsew")
+        self.group_by_folder_frame.grid_remove()  # Options de grid conservées pour les réaffichages
         
         # Zone scrollable pour les groupes
         self.folder_groups_scrollable = ctk.CTkScrollableFrame(
@@ -437,18 +582,25 @@ class FileSearchZoneView(ctk.CTkFrame):
         )
         self.folder_groups_scrollable.pack(fill="both", expand=True, padx=2, pady=2)
         
-        # Label indicatif (sera remplacé par votre implémentation)
-        info_label = ctk.CTkLabel(
+        # Label indicatif, réutilisé ensuite pour "Aucun résultat"
+        self.folder_info_label = ctk.CTkLabel(
             self.folder_groups_scrollable,
             text="Zone d'affichage pour le groupement par n° de dossier\n(À implémenter selon vos spécifications)",
             font=("Arial", 14),
             text_color="gray"
         )
-        info_label.pack(pady=50)
+        self.folder_info_label.pack(pady=50)
+
+        # Conteneur des cartes, affiché dès qu'il y a des résultats. Les cartes
+        # sont recyclées d'un rafraîchissement à l'autre (pool).
+        self.folder_cards_container = ctk.CTkFrame(self.folder_groups_scrollable, fg_color="transparent")
+        self._folder_cards = []
 
     def _create_group_by_location_zone(self):
         """Crée la zone d'affichage groupé par localité."""
         self.group_by_location_frame = ctk.CTkFrame(self.main_display_frame, fg_color="transparent")
+        self.group_by_location_frame.grid(row=0, column=0, sticky="nsew")
+        self.group_by_location_frame.grid_remove()  # Options de grid conservées pour les réaffichages
         
         # Zone scrollable pour les groupes
         self.location_groups_scrollable = ctk.CTkScrollableFrame(
@@ -457,44 +609,73 @@ class FileSearchZoneView(ctk.CTkFrame):
         )
         self.location_groups_scrollable.pack(fill="both", expand=True, padx=2, pady=2)
         
-        # Label indicatif (sera remplacé par votre implémentation)
-        info_label = ctk.CTkLabel(
+        # Label indicatif, réutilisé ensuite pour "Aucun résultat"
+        self.location_info_label = ctk.CTkLabel(
             self.location_groups_scrollable,
             text="Zone d'affichage pour le groupement par localité\n(À implémenter selon vos spécifications)",
             font=("Arial", 14),
             text_color="gray"
         )
-        info_label.pack(pady=50)
+        self.location_info_label.pack(pady=50)
+
+        # Conteneur des cartes, affiché dès qu'il y a des résultats. Les cartes
+        # sont recyclées d'un rafraîchissement à l'autre (pool).
+        self.location_cards_container = ctk.CTkFrame(self.location_groups_scrollable, fg_color="transparent")
+        self._location_cards = []
 
     def _switch_display_mode(self, mode):
         """NOUVEAU : Change le mode d'affichage."""
-        print(f"DEBUG: Changement vers le mode d'affichage: {mode}")
-        
-        # Cacher toutes les zones d'affichage
-        if hasattr(self, 'list_display_frame'):
-            self.list_display_frame.grid_forget()
-        if hasattr(self, 'group_by_date_frame'):
-            self.group_by_date_frame.grid_forget()
-        if hasattr(self, 'group_by_folder_frame'):
-            self.group_by_folder_frame.grid_forget()
-        if hasattr(self, 'group_by_location_frame'):
-            self.group_by_location_frame.grid_forget()
-
-        # Afficher la zone correspondante au mode
+        logger.debug("Changement vers le mode d'affichage : %s", mode)
+        
+        # Cacher toutes les zones d'affichage déjà créées
+        self.list_display_frame.grid_remove()
+        if self.group_by_date_frame is not None:
+            self.group_by_date_frame.grid_remove()
+        if self.group_by_folder_frame is not None:
+            self.group_by_folder_frame.grid_remove()
+        if self.group_by_location_frame is not None:
+            self.group_by_location_frame.grid_remove()
+
+        # Afficher la zone correspondante au mode (créée au premier affichage)
         self.current_display_mode = mode
         
         if mode == "list":
-            self.list_display_frame.grid(row=0, column=0, sticky="nsew")
+            self.list_display_frame.grid()
+        elif mode == "group_by_date":
+            if self.group_by_date_frame is None:
+                self._create_group_by_date_zone()
+            self.group_by_date_frame.grid()
+        elif mode == "group_by_folder":
+            if self.group_by_folder_frame is None:
+                self._create_group_by_folder_zone()
+            self.group_by_folder_frame.grid()
+        elif mode == "group_by_location":
+            if self.group_by_location_frame is None:
+                self._create_group_by_location_zone()
+            self.group_by_location_frame.grid()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Planifie le rafraîchissement du mode courant ; les demandes rapprochées n'en font qu'un."""
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after_idle(self._run_pending_refresh)
+
+    def _run_pending_refresh(self):
+        """Exécute le rafraîchissement planifié pour le mode affiché à cet instant."""
+        self._pending_refresh = None
+        mode = self.current_display_mode
+        if self._rendered_revision.get(mode) == self._results_revision:
+            return
+        if mode == "list":
             self._refresh_list_display()
         elif mode == "group_by_date":
-            self.group_by_date_frame.grid(row=0, column=0, sticky="nsew")
             self._refresh_group_by_date_display()
         elif mode == "group_by_folder":
-            self.group_by_folder_frame.grid(row=0, column=0, sticky="nsew")
             self._refresh_group_by_folder_display()
         elif mode == "group_by_location":
-            self.group_by_location_frame.grid(row=0, column=0, sticky="nsew")
             self._refresh_group_by_location_display()
+        self._rendered_revision[mode] = self._results_revision
 
     def _refresh_list_display(self):
         """Rafraîchit l'affichage en mode liste."""
@@ -503,61 +684,78 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _refresh_group_by_date_display(self):
         """NOUVEAU : Rafraîchit l'affichage groupé par date."""
-        print("DEBUG: Rafraîchissement de l'affichage groupé par date")
+        logger.debug("Rafraîchissement de l'affichage groupé par date")
         # Ici vous implémenterez votre logique de groupement par date
         # Les données sont disponibles dans self.current_results
         pass
 
     def _refresh_group_by_folder_display(self):
         """Rafraîchit l'affichage groupé par n° de dossier."""
-        print("DEBUG: Rafraîchissement de l'affichage groupé par dossier")
-
-        # Nettoyer les widgets existants
-        for widget in self.folder_groups_scrollable.winfo_children():
-            widget.destroy()
+        logger.debug("Rafraîchissement de l'affichage groupé par dossier")
 
         if not self.current_results:
-            no_result_label = ctk.CTkLabel(
-                self.folder_groups_scrollable,
-                text="Aucun résultat à afficher",
-                font=("Arial", 14),
-                text_color="gray"
-            )
-            no_result_label.pack(pady=50)
+            self._show_no_group_result(self.folder_cards_container, self.folder_info_label)
             return
 
-        # Grouper les résultats par Job Number
-        grouped_results = {}
-        for result in self.current_results:
-            job_number = result.get('Job Number', 'N/A')
-            if job_number not in grouped_results:
-                grouped_results[job_number] = []
-            grouped_results[job_number].append(result)
+        # Grouper les résultats par Job Number (lieu le plus fréquent)
+        summaries = self._compute_all_group_summaries(
+            self.current_results, 'Job Number', 'Location', "Lieux divers", "📍"
+        )
+
+        self._update_cards_grid(
+            self.folder_cards_container, self.folder_info_label, self._folder_cards,
+            summaries, self._create_folder_card, self._fill_folder_card
+        )
+
+    def _show_no_group_result(self, cards_container, info_label):
+        """Masque les cartes d'une zone groupée et affiche "Aucun résultat"."""
+        cards_container.pack_forget()
+        info_label.configure(text="Aucun résultat à afficher")
+        info_label.pack(pady=50)
 
-        # Créer un frame conteneur avec grid pour l'affichage des cartes
-        cards_container = ctk.CTkFrame(self.folder_groups_scrollable, fg_color="transparent")
+    def _update_cards_grid(self, cards_container, info_label, cards_pool, summaries,
+                           create_card, fill_card):
+        """Affiche une carte par groupe en recyclant les cartes déjà créées."""
+        info_label.pack_forget()
         cards_container.pack(fill="both", expand=True, padx=5, pady=5)
 
         # Variables pour la disposition en grille
-        row = 0
-        col = 0
         max_cols = 3  # Nombre maximum de colonnes
 
-        # Créer une carte pour chaque dossier
-        for job_number, results in grouped_results.items():
-            card = self._create_folder_card(cards_container, job_number, results)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-
-            # Configurer le poids des colonnes pour une répartition équitable
-            cards_container.grid_columnconfigure(col, weight=1, uniform="cards")
-
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        for index, (group_key, summary) in enumerate(summaries.items()):
+            if index < len(cards_pool):
+                card_widgets = cards_pool[index]
+            else:
+                # Une carte garde toujours la même case : placée une seule fois
+                card_widgets = create_card(cards_container)
+                row, col = divmod(index, max_cols)
+                card_widgets["card"].grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+                card_widgets["visible"] = True
+                cards_pool.append(card_widgets)
+            fill_card(card_widgets, group_key, summary)
+            if not card_widgets["visible"]:
+                card_widgets["card"].grid()
+                card_widgets["visible"] = True
+
+        # Masquer les cartes en surplus (gardées pour un prochain affichage)
+        for card_widgets in cards_pool[len(summaries):]:
+            if card_widgets["visible"]:
+                card_widgets["card"].grid_remove()
+                card_widgets["visible"] = False
+
+        # Répartition équitable entre les colonnes effectivement utilisées,
+        # reconfigurée seulement quand leur nombre change
+        used_cols = min(len(summaries), max_cols)
+        if self._cards_used_cols.get(str(cards_container)) != used_cols:
+            for col in range(max_cols):
+                if col < used_cols:
+                    cards_container.grid_columnconfigure(col, weight=1, uniform="cards")
+                else:
+                    cards_container.grid_columnconfigure(col, weight=0, uniform="")
+            self._cards_used_cols[str(cards_container)] = used_cols
 
-    def _create_folder_card(self, parent, job_number, results):
-        """Crée une carte pour un dossier avec toutes ses informations."""
+    def _create_folder_card(self, parent):
+        """Crée les widgets (vides) d'une carte de dossier."""
         # Frame principal de la carte (fond blanc)
         card = ctk.CTkFrame(
             parent,
@@ -570,219 +768,170 @@ class FileSearchZoneView(ctk.CTkFrame):
         # Header sous forme de bouton (remplace CTkFrame + CTkLabel)
         header_button = ctk.CTkButton(
             card,
-            text=job_number,
+            text="",
             font=("Verdana", 18, "bold"),
             fg_color="#002AC2",
             hover_color="#0015A0",
             text_color="white",
             corner_radius=8,
-            height=35,
-            command=lambda: self._on_card_header_click(job_number, "dossier")
+            height=35
         )
         header_button.pack(fill="x", padx=5, pady=5)
 
-        # Déterminer le lieu le plus fréquent
-        location = self._get_most_frequent_location(results)
-
-        # Nombre de CPT
-        cpt_count = len(results)
-
-        # Déterminer les dates (plus ancienne et plus récente)
-        date_text = self._get_date_range(results)
-
-        # Extraire les opérateurs
-        operators_text = self._extract_operators(results)
-
-        # Affichage du lieu
-        location_label = ctk.CTkLabel(
+        # Un seul label multi-ligne (lieu / dossier, nombre de CPT, dates,
+        # opérateurs) plutôt qu'un widget par information
+        details_label = ctk.CTkLabel(
             card,
-            text=f"📍 {location.upper()}",
-            font=("Verdana", 14, "bold"),
-            text_color="#000000",
-            anchor="w",
-            height=16
-        )
-        location_label.pack(fill="x", padx=10, pady=0)
-
-        # Affichage du nombre de CPT
-        cpt_label = ctk.CTkLabel(
-            card,
-            text=f"{cpt_count} CPT",
-            font=("Verdana", 14, "bold", "italic"),
-            text_color="#0115B8",
-            anchor="w"
-        )
-        cpt_label.pack(fill="x", padx=10, pady=0)
-
-        # Affichage des dates
-        date_label = ctk.CTkLabel(
-            card,
-            text=date_text,
+            text="",
             font=("Verdana", 13),
             text_color="#000000",
-            anchor="w"
-        )
-        date_label.pack(fill="x", padx=10, pady=0)
-
-        # Affichage des opérateurs avec icône
-        operators_label = ctk.CTkLabel(
-            card,
-            text=f"👤 {operators_text.upper()}",
-            font=("Verdana", 13, "italic"),
-            text_color="#666666",
             anchor="w",
-            height=14,
+            justify="left",
             wraplength=250  # Pour gérer les longues listes d'opérateurs
         )
-        operators_label.pack(fill="x", padx=10, pady=(1, 10))
-
-        return card
+        details_label.pack(fill="x", padx=10, pady=(0, 10))
 
-    def _get_most_frequent_location(self, results):
-        """Détermine le lieu le plus fréquent parmi les résultats."""
-        try:
-            locations = {}
-            for result in results:
-                location = result.get('Location', 'N/A')
-                if location and location != 'N/A':
-                    locations[location] = locations.get(location, 0) + 1
+        return {
+            "card": card,
+            "header_button": header_button,
+            "details_label": details_label,
+        }
 
-            if not locations:
-                return "Lieux divers"
+    def _fill_folder_card(self, card_widgets, job_number, summary):
+        """Met à jour une carte de dossier avec le résumé précalculé du groupe."""
+        self._apply_card_summary(card_widgets, job_number, job_number, "dossier", summary)
 
-            # Trouver le lieu avec le plus d'occurrences
-            max_count = max(locations.values())
-            most_frequent = [loc for loc, count in locations.items() if count == max_count]
+    def _apply_card_summary(self, card_widgets, header_text, search_value, search_type, summary):
+        """Applique les textes d'une carte recyclée, en ne touchant qu'aux widgets modifiés."""
+        if card_widgets.get("header_text") != header_text:
+            card_widgets["header_button"].configure(
+                text=header_text,
+                command=lambda: self._on_card_header_click(search_value, search_type)
+            )
+            card_widgets["header_text"] = header_text
 
-            # Si plusieurs lieux ont le même nombre d'occurrences
-            if len(most_frequent) > 1:
-                return "Lieux divers"
+        shown = card_widgets.setdefault("texts", {})
+        for widget_key, text in summary.items():
+            if shown.get(widget_key) != text:
+                card_widgets[widget_key].configure(text=text)
+                shown[widget_key] = text
 
-            return most_frequent[0]
-        except Exception as e:
-            print(f"Erreur dans _get_most_frequent_location: {e}")
-            return "Lieux divers"
+    def _compute_all_group_summaries(self, results, group_key, count_field, fallback, info_icon):
+        """Calcule en un seul parcours les résumés de tous les groupes.
 
-    def _get_date_range(self, results):
-        """Détermine la plage de dates (du ... au ...) ou une date unique."""
+        Chaque résultat est rangé dans l'agrégat de son groupe (``group_key``),
+        qui tient à jour les occurrences de ``count_field``, les bornes de
+        dates et les opérateurs. Retourne ``{groupe: textes de la carte}``
+        dans l'ordre d'apparition des groupes.
+        """
+        buckets = {}
         try:
-            from datetime import datetime
-
-            dates = []
             for result in results:
-                date_str = result.get('Date', '')
-                if date_str and date_str != 'N/A':
-                    try:
-                        # Essayer différents formats de date
-                        for fmt in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                            try:
-                                date_obj = datetime.strptime(date_str, fmt)
-                                dates.append(date_obj)
-                                break
-                            except ValueError:
-                                continue
-                    except:
-                        pass
-
-            if not dates:
-                return "Date non disponible"
+                get = result.get
+                group = get(group_key, 'N/A')
+                bucket = buckets.get(group)
+                if bucket is None:
+                    bucket = buckets[group] = _GroupBucket()
+                bucket.count += 1
+
+                # Occurrences du champ compté (lieu ou n° de dossier)
+                value = get(count_field)
+                if value and value != 'N/A':
+                    bucket.counts[value] += 1
 
-            # Trier les dates
-            dates.sort()
+                # Date (parsée une seule fois par valeur distincte)
+                date_str = get('Date')
+                if date_str and date_str != 'N/A':
+                    date_obj = _parse_result_date(date_str)
+                    if date_obj is not None:
+                        if bucket.oldest is None or date_obj < bucket.oldest:
+                            bucket.oldest = date_obj
+                        if bucket.newest is None or date_obj > bucket.newest:
+                            bucket.newest = date_obj
+
+                # Opérateurs : séparer par espace, / ou -
+                operator_str = get('Operator')
+                if operator_str and operator_str != 'N/A':
+                    for part in _OPERATOR_SPLIT_RE.split(operator_str):
+                        part = part.strip()
+                        if part and len(part) > 1:  # Ignorer les initiales seules
+                            bucket.operators.add(part)
+        except Exception:
+            logger.exception("Erreur dans _compute_all_group_summaries")
 
-            # Si une seule date ou toutes identiques
-            if len(set(dates)) == 1:
-                return f"le {dates[0].strftime('%d/%m/%Y')}"
+        return {
+            group: self._format_group_summary(bucket, fallback, info_icon)
+            for group, bucket in buckets.items()
+        }
 
-            # Sinon, afficher la plage
-            oldest = dates[0].strftime('%d/%m/%Y')
-            newest = dates[-1].strftime('%d/%m/%Y')
-            return f"du {oldest}\nau {newest}"
+    def _format_group_summary(self, bucket, fallback, info_icon):
+        """Formate les textes d'une carte à partir de l'agrégat de son groupe.
 
-        except Exception as e:
-            print(f"Erreur dans _get_date_range: {e}")
-            return "Date non disponible"
+        Le label de détails regroupe sur plusieurs lignes la valeur la plus
+        fréquente (ou ``fallback``), le nombre de CPT, la plage de dates et
+        les opérateurs.
+        """
+        return {
+            "details_label": "\n".join((
+                f"{info_icon} {self._most_frequent(bucket.counts, fallback).upper()}",
+                f"{bucket.count} CPT",
+                self._format_date_range(bucket.oldest, bucket.newest),
+                f"👤 {self._format_operators(bucket.operators).upper()}",
+            )),
+        }
 
-    def _extract_operators(self, results):
-        """Extrait et formate la liste des opérateurs uniques."""
-        import re
+    def _most_frequent(self, counts, fallback):
+        """Retourne la valeur la plus fréquente, ou ``fallback`` si absente ou ex aequo."""
+        top = counts.most_common(2)
+        if not top:
+            return fallback
 
-        try:
-            operators_set = set()
+        # Si plusieurs valeurs ont le même nombre d'occurrences
+        if len(top) == 2 and top[0][1] == top[1][1]:
+            return fallback
 
-            for result in results:
-                operator_str = result.get('Operator', '')
-                if operator_str and operator_str != 'N/A':
-                    # Séparer par espace, / ou -
-                    parts = re.split(r'[\s/\-]+', operator_str)
-                    for part in parts:
-                        part = part.strip()
-                        if part and len(part) > 1:  # Ignorer les initiales seules
-                            operators_set.add(part)
+        return top[0][0]
 
-            if not operators_set:
-                return "Opérateur non spécifié"
+    def _format_date_range(self, oldest, newest):
+        """Formate la plage de dates (du ... au ...) ou une date unique."""
+        if oldest is None:
+            return "Date non disponible"
 
-            # Convertir en liste et trier
-            operators_list = sorted(list(operators_set))
+        # Si une seule date ou toutes identiques
+        if oldest == newest:
+            return f"le {oldest.strftime('%d/%m/%Y')}"
 
-            # Joindre avec des virgules
-            return ", ".join(operators_list)
+        # Sinon, afficher la plage
+        return f"du {oldest.strftime('%d/%m/%Y')}\nau {newest.strftime('%d/%m/%Y')}"
 
-        except Exception as e:
-            print(f"Erreur dans _extract_operators: {e}")
+    def _format_operators(self, operators_set):
+        """Formate la liste triée des opérateurs uniques."""
+        if not operators_set:
             return "Opérateur non spécifié"
 
+        # Trier et joindre avec des virgules
+        return ", ".join(sorted(operators_set))
+
     def _refresh_group_by_location_display(self):
         """Rafraîchit l'affichage groupé par localité."""
-        print("DEBUG: Rafraîchissement de l'affichage groupé par localité")
-
-        # Nettoyer les widgets existants
-        for widget in self.location_groups_scrollable.winfo_children():
-            widget.destroy()
+        logger.debug("Rafraîchissement de l'affichage groupé par localité")
 
         if not self.current_results:
-            no_result_label = ctk.CTkLabel(
-                self.location_groups_scrollable,
-                text="Aucun résultat à afficher",
-                font=("Arial", 14),
-                text_color="gray"
-            )
-            no_result_label.pack(pady=50)
+            self._show_no_group_result(self.location_cards_container, self.location_info_label)
             return
 
-        # Grouper les résultats par Location
-        grouped_results = {}
-        for result in self.current_results:
-            location = result.get('Location', 'N/A')
-            if location not in grouped_results:
-                grouped_results[location] = []
-            grouped_results[location].append(result)
-
-        # Créer un frame conteneur avec grid pour l'affichage des cartes
-        cards_container = ctk.CTkFrame(self.location_groups_scrollable, fg_color="transparent")
-        cards_container.pack(fill="both", expand=True, padx=5, pady=5)
-
-        # Variables pour la disposition en grille
-        row = 0
-        col = 0
-        max_cols = 3  # Nombre maximum de colonnes
-
-        # Créer une carte pour chaque localité
-        for location, results in grouped_results.items():
-            card = self._create_location_card(cards_container, location, results)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-
-            # Configurer le poids des colonnes pour une répartition équitable
-            cards_container.grid_columnconfigure(col, weight=1, uniform="cards")
+        # Grouper les résultats par Location (n° de dossier le plus fréquent)
+        summaries = self._compute_all_group_summaries(
+            self.current_results, 'Location', 'Job Number', "Dossiers divers", "📋"
+        )
 
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        self._update_cards_grid(
+            self.location_cards_container, self.location_info_label, self._location_cards,
+            summaries, self._create_location_card, self._fill_location_card
+        )
 
-    def _create_location_card(self, parent, location, results):
-        """Crée une carte pour une localité avec toutes ses informations."""
+    def _create_location_card(self, parent):
+        """Crée les widgets (vides) d'une carte de localité."""
         # Frame principal de la carte (fond blanc)
         card = ctk.CTkFrame(
             parent,
@@ -795,98 +944,38 @@ class FileSearchZoneView(ctk.CTkFrame):
         # Header sous forme de bouton (remplace CTkFrame + CTkLabel)
         header_button = ctk.CTkButton(
             card,
-            text=location.upper(),
+            text="",
             font=("Verdana", 16, "bold"),
             fg_color="#0B4354",
             hover_color="#105A70",
             text_color="white",
             corner_radius=8,
-            height=35,
-            command=lambda: self._on_card_header_click(location, "lieu")
+            height=35
         )
         header_button.pack(fill="x", padx=5, pady=5)
 
-        # Déterminer le n° de dossier le plus fréquent
-        job_number = self._get_most_frequent_job_number(results)
-
-        # Nombre de CPT
-        cpt_count = len(results)
-
-        # Déterminer les dates (plus ancienne et plus récente)
-        date_text = self._get_date_range(results)
-
-        # Extraire les opérateurs
-        operators_text = self._extract_operators(results)
-
-        # Affichage du n° de dossier (INVERSION par rapport au groupement par dossier)
-        job_number_label = ctk.CTkLabel(
-            card,
-            text=f"📋 {job_number.upper()}",
-            font=("Verdana", 14, "bold"),
-            text_color="#000000",
-            anchor="w",
-            height=16
-        )
-        job_number_label.pack(fill="x", padx=10, pady=0)
-
-        # Affichage du nombre de CPT
-        cpt_label = ctk.CTkLabel(
-            card,
-            text=f"{cpt_count} CPT",
-            font=("Verdana", 14, "bold", "italic"),
-            text_color="#0B4354",
-            anchor="w"
-        )
-        cpt_label.pack(fill="x", padx=10, pady=0)
-
-        # Affichage des dates
-        date_label = ctk.CTkLabel(
+        # Un seul label multi-ligne (lieu / dossier, nombre de CPT, dates,
+        # opérateurs) plutôt qu'un widget par information
+        details_label = ctk.CTkLabel(
             card,
-            text=date_text,
+            text="",
             font=("Verdana", 13),
             text_color="#000000",
-            anchor="w"
-        )
-        date_label.pack(fill="x", padx=10, pady=0)
-
-        # Affichage des opérateurs avec icône
-        operators_label = ctk.CTkLabel(
-            card,
-            text=f"👤 {operators_text.upper()}",
-            font=("Verdana", 13, "italic"),
-            text_color="#666666",
             anchor="w",
-            height=14,
+            justify="left",
             wraplength=250  # Pour gérer les longues listes d'opérateurs
         )
-        operators_label.pack(fill="x", padx=10, pady=(1, 10))
-
-        return card
-
-    def _get_most_frequent_job_number(self, results):
-        """Détermine le n° de dossier le plus fréquent parmi les résultats."""
-        try:
-            job_numbers = {}
-            for result in results:
-                job_number = result.get('Job Number', 'N/A')
-                if job_number and job_number != 'N/A':
-                    job_numbers[job_number] = job_numbers.get(job_number, 0) + 1
-
-            if not job_numbers:
-                return "Dossiers divers"
-
-            # Trouver le n° de dossier avec le plus d'occurrences
-            max_count = max(job_numbers.values())
-            most_frequent = [job for job, count in job_numbers.items() if count == max_count]
+        details_label.pack(fill="x", padx=10, pady=(0, 10))
 
-            # Si plusieurs n° de dossier ont le même nombre d'occurrences
-            if len(most_frequent) > 1:
-                return "Dossiers divers"
+        return {
+            "card": card,
+            "header_button": header_button,
+            "details_label": details_label,
+        }
 
-            return most_frequent[0]
-        except Exception as e:
-            print(f"Erreur dans _get_most_frequent_job_number: {e}")
-            return "Dossiers divers"
+    def _fill_location_card(self, card_widgets, location, summary):
+        """Met à jour une carte de localité avec le résumé précalculé du groupe."""
+        self._apply_card_summary(card_widgets, location.upper(), location, "lieu", summary)
 
     def _on_card_header_click(self, search_value, search_type):
         """Gère le clic sur le header d'une carte de résultat groupé.
@@ -900,6 +989,7 @@ class FileSearchZoneView(ctk.CTkFrame):
         # Mettre à jour le champ de recherche avec la valeur du header
         self.search_entry.delete(0, 'end')
         self.search_entry.insert(0, search_value)
+        self._last_query = str(search_value).strip()
 
         # Passer automatiquement en mode "affichage liste"
         self._switch_display_mode("list")
@@ -925,6 +1015,9 @@ class FileSearchZoneView(ctk.CTkFrame):
             self.headers_container.grid_columnconfigure(i, weight=col_config["weight"])
         
         self.header_buttons = {}
+        # Texte d'origine de chaque en-tête, indexé par clé de colonne
+        self._col_text_by_key = {col["key"]: col["text"] for col in self.columns_config}
+        self._last_sorted_col = None  # Seul en-tête portant une flèche de tri
         
         # Tous les boutons sans coins arrondis individuels
         for i, col_config in enumerate(self.columns_config):
@@ -967,15 +1060,18 @@ class FileSearchZoneView(ctk.CTkFrame):
     def _create_search_icon(self):
         """Crée l'icône de recherche sur le côté droit du champ de saisie."""
         try:
-            # Charger l'image depuis le dossier 'icons'
-            icon_path = get_resource_path(os.path.join("icons", "search.png"))
-            image = Image.open(icon_path)
+            search_icon_image = FileSearchZoneView._search_icon_image
+            if search_icon_image is None:
+                # Charger l'image depuis le dossier 'icons'
+                icon_path = get_resource_path(os.path.join("icons", "search.png"))
+                image = Image.open(icon_path)
 
-            # Redimensionner l'image pour qu'elle s'adapte au bouton
-            image = image.resize((20, 20), Image.Resampling.LANCZOS)
+                # Redimensionner l'image pour qu'elle s'adapte au bouton
+                image = image.resize((20, 20), Image.Resampling.LANCZOS)
 
-            # Créer l'objet CTkImage pour CustomTkinter
-            search_icon_image = ctk.CTkImage(light_image=image, dark_image=image, size=(20, 20))
+                # Créer l'objet CTkImage pour CustomTkinter
+                search_icon_image = ctk.CTkImage(light_image=image, dark_image=image, size=(20, 20))
+                FileSearchZoneView._search_icon_image = search_icon_image
 
             # Créer le bouton avec l'icône
             self.search_icon_button = ctk.CTkButton(
@@ -1046,7 +1142,7 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _on_display_mode_change(self, mode):
         """NOUVEAU : Gère le changement de mode d'affichage."""
-        print(f"DEBUG: Changement de mode demandé: {mode}")
+        logger.debug("Changement de mode demandé : %s", mode)
         
         # Changer le mode d'affichage
         self._switch_display_mode(mode)
@@ -1189,67 +1285,79 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _sort_current_results(self, column_key, reverse):
         """Trie les résultats actuels selon la colonne spécifiée."""
-        def get_sort_key(result):
-            if column_key == "#0":
-                value = result.get('file_name', '')
-            else:
-                # Mapper les clés de colonnes aux clés de données
-                key_mapping = {
-                    "dossier": "Job Number",
-                    "essai": "TestNumber",
-                    "lieu": "Location",
-                    "date": "Date",
-                    "operateur": "Operator"
-                }
-                value = result.get(key_mapping.get(column_key, ''), '')
-            
-            # Traitement spécial pour la colonne essai : tri numérique
-            if column_key == "essai":
-                import re
-                # Extraire le premier nombre trouvé dans la chaîne
-                if value and value != 'N/A':
-                    match = re.search(r'\d+', str(value))
-                    if match:
-                        return int(match.group())
-                # Si pas de nombre trouvé, retourner -1 pour mettre en début/fin
-                return -1 if not reverse else float('inf')
-            
-            # Retourner une chaîne vide si valeur manquante, sinon convertir en minuscules
-            return str(value).lower() if value and value != 'N/A' else ''
-        
-        self.current_results.sort(key=get_sort_key, reverse=reverse)
+        # Traitement spécial pour la colonne essai : tri numérique
+        if column_key == "essai":
+            # Si pas de nombre trouvé, mettre la ligne en début de liste
+            missing = -1 if not reverse else float('inf')
+            decorated = []
+            for result in self.current_results:
+                value = result.get('TestNumber', '')
+                match = _ESSAI_RE.search(str(value)) if value and value != 'N/A' else None
+                decorated.append((int(match.group()) if match else missing, result))
+            decorated.sort(key=itemgetter(0), reverse=reverse)
+            self.current_results = [result for _, result in decorated]
+        elif column_key == "date":
+            # Tri chronologique : dates parsées une seule fois (cache par
+            # chaîne), les dates absentes ou non reconnues en premier
+            decorated = []
+            for result in self.current_results:
+                value = result.get('Date')
+                date_obj = _parse_result_date(value) if isinstance(value, str) and value else None
+                key = (True, date_obj) if date_obj is not None else (False, datetime.datetime.min)
+                decorated.append((key, result))
+            decorated.sort(key=itemgetter(0), reverse=reverse)
+            self.current_results = [result for _, result in decorated]
+        else:
+            data_key = self._SORT_KEY_MAPPING.get(column_key, '')
+
+            def get_sort_key(result):
+                # Chaîne vide si valeur manquante, sinon minuscules
+                value = result.get(data_key, '')
+                return str(value).lower() if value and value != 'N/A' else ''
+
+            self.current_results.sort(key=get_sort_key, reverse=reverse)
+        self._results_revision += 1
 
 
     def _refresh_treeview_display(self):
         """Rafraîchit l'affichage du Treeview avec les données triées."""
-        # Effacer le contenu actuel
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Réafficher les résultats triés
+        tree = self.results_tree
+
+        # Effacer le contenu actuel en un seul appel Tk
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        self._selected_items = set()
+
+        # Préparer toutes les lignes avant de les insérer
+        contains = self.model.raw_data_manager.contains
+        rows = []
         for i, result in enumerate(self.current_results):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
+            get = result.get
+            tags = _EVEN_TAGS if i % 2 == 0 else _ODD_TAGS
 
             # Vérifier si le fichier est déjà dans les données brutes
-            file_path = result.get('file_path', '')
-            if file_path and self.model.raw_data_manager.contains(file_path):
-                tag = 'in_raw_data'
-
-            file_display = f"📈 {result.get('file_name', 'N/A')}"
-
-            self.results_tree.insert(
-                "",
-                "end",
-                text=file_display,
-                values=(
-                    result.get('Job Number', 'N/A'),
-                    result.get('TestNumber', 'N/A'),
-                    result.get('Location', 'N/A'),
-                    result.get('Date', 'N/A'),
-                    result.get('Operator', 'N/A')
+            file_path = get('file_path', '')
+            if file_path and contains(file_path):
+                tags = _IN_RAW_DATA_TAGS
+
+            rows.append((
+                f"📈 {get('file_name', 'N/A')}",
+                (
+                    get('Job Number', 'N/A'),
+                    get('TestNumber', 'N/A'),
+                    get('Location', 'N/A'),
+                    get('Date', 'N/A'),
+                    get('Operator', 'N/A')
                 ),
-                tags=(tag,)
-            )
+                tags
+            ))
+
+        # Réafficher les résultats triés
+        insert = tree.insert
+        for text, values, tags in rows:
+            insert("", "end", text=text, values=values, tags=tags)
+        self._rendered_revision["list"] = self._results_revision
 
     def _on_raw_data_changed(self):
         """Callback du RawDataManager : rafraîchit le treeview pour mettre à jour le fond vert."""
@@ -1260,18 +1368,19 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _update_header_indicators(self, sorted_column, reverse):
         """Met à jour les indicateurs visuels des en-têtes."""
-        # Réinitialiser tous les en-têtes
-        for col_config in self.columns_config:
-            original_text = col_config["text"]
-            self.header_buttons[col_config["key"]].configure(text=original_text)
+        # Réinitialiser l'en-tête précédemment trié (les autres n'ont pas de flèche)
+        last_col = self._last_sorted_col
+        if last_col is not None and last_col != sorted_column:
+            self.header_buttons[last_col].configure(text=self._col_text_by_key[last_col])
+            self._last_sorted_col = None
         
         # Ajouter l'indicateur sur la colonne triée
         if sorted_column in self.header_buttons:
-            # Trouver le texte original
-            original_text = next(col["text"] for col in self.columns_config if col["key"] == sorted_column)
+            original_text = self._col_text_by_key[sorted_column]
             arrow = " 🔽" if reverse else " 🔼"
             new_text = original_text + arrow
             self.header_buttons[sorted_column].configure(text=new_text)
+            self._last_sorted_col = sorted_column
 
     def _on_treeview_hover(self, event):
         """Effet de hover sur les lignes."""
@@ -1282,14 +1391,12 @@ class FileSearchZoneView(ctk.CTkFrame):
             if self.hovered_item:
                 self._reset_item_style(self.hovered_item)
             
-            # Appliquer hover sur le nouvel item (sauf si déjà dans données brutes)
-            if item:
-                current_tags = list(self.results_tree.item(item)['tags'])
-                if 'in_raw_data' not in current_tags:
-                    if 'hover' not in current_tags:
-                        current_tags.append('hover')
-                    self.results_tree.item(item, tags=current_tags)
-                self.hovered_item = item
+            # Appliquer hover sur le nouvel item (sauf si déjà dans données brutes),
+            # en ne réécrivant les tags que s'ils changent
+            current_tags = self.results_tree.item(item, 'tags')
+            if 'in_raw_data' not in current_tags and 'hover' not in current_tags:
+                self.results_tree.item(item, tags=(*current_tags, 'hover'))
+            self.hovered_item = item
 
     def _on_treeview_leave(self, event):
         """Réinitialise le hover quand on sort du Treeview."""
@@ -1304,7 +1411,7 @@ class FileSearchZoneView(ctk.CTkFrame):
         try:
             item_data = self.results_tree.item(item)
             file_display = item_data["text"]
-            if not file_display or any(s in file_display for s in ["Recherche", "Aucun résultat", "Indexation"]):
+            if not file_display or file_display.startswith(_SPECIAL_PREFIXES):
                 return None
 
             file_name = file_display
@@ -1312,9 +1419,9 @@ class FileSearchZoneView(ctk.CTkFrame):
                 file_name = file_name[2:]
             file_name = file_name.strip()
 
-            for result in self.current_results:
-                if result.get("file_name", "").strip() == file_name:
-                    return result
+            result = self._results_by_filename.get(file_name)
+            if result is not None:
+                return result
 
             # Fallback : reconstruire depuis les valeurs du treeview
             values = item_data.get("values", ())
@@ -1359,7 +1466,7 @@ class FileSearchZoneView(ctk.CTkFrame):
     def _show_context_menu(self, event, result_data):
         """Affiche un menu contextuel moderne (CTkFrame popup)."""
         # Détruire un éventuel menu précédent
-        if hasattr(self, "_context_menu") and self._context_menu and self._context_menu.winfo_exists():
+        if self._context_menu is not None and self._context_menu.winfo_exists():
             self._context_menu.destroy()
 
         root = self.winfo_toplevel()
@@ -1417,7 +1524,7 @@ class FileSearchZoneView(ctk.CTkFrame):
         # Fermer le menu au clic ailleurs
         def _close_menu(e):
             try:
-                if hasattr(self, "_context_menu") and self._context_menu and self._context_menu.winfo_exists():
+                if self._context_menu is not None and self._context_menu.winfo_exists():
                     self._context_menu.destroy()
             except Exception:
                 pass
@@ -1427,14 +1534,14 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _context_menu_add(self, result_data):
         """Action du menu contextuel : ajouter un fichier."""
-        if hasattr(self, "_context_menu") and self._context_menu.winfo_exists():
+        if self._context_menu is not None and self._context_menu.winfo_exists():
             self._context_menu.destroy()
         if self.presenter:
             self.presenter.on_add_to_raw_data(result_data)
 
     def _context_menu_add_selection(self):
         """Action du menu contextuel : ajouter toute la sélection."""
-        if hasattr(self, "_context_menu") and self._context_menu.winfo_exists():
+        if self._context_menu is not None and self._context_menu.winfo_exists():
             self._context_menu.destroy()
         self._add_current_selection_to_raw_data()
 
@@ -1567,15 +1674,17 @@ class FileSearchZoneView(ctk.CTkFrame):
     def _reset_item_style(self, item):
         """Réinitialise le style d'un item à son état original."""
         try:
-            current_tags = list(self.results_tree.item(item)['tags'])
+            info = self.results_tree.item(item)  # Un seul aller-retour Tk
+            current_tags = list(info['tags'])
+            original_tags = list(current_tags)
             
             # Retirer le hover
             if 'hover' in current_tags:
                 current_tags.remove('hover')
             
             # S'assurer qu'il a son tag original si ce n'est pas un item spécial
-            item_text = self.results_tree.item(item)['text']
-            if not any(special in item_text for special in ['🔍 Recherche', 'Aucun résultat', 'Indexation']):
+            item_text = info['text']
+            if not item_text.startswith(_SPECIAL_PREFIXES):
                 if 'evenrow' not in current_tags and 'oddrow' not in current_tags and 'selected' not in current_tags and 'in_raw_data' not in current_tags:
                     # Recalculer le tag original basé sur l'index
                     try:
@@ -1586,34 +1695,41 @@ class FileSearchZoneView(ctk.CTkFrame):
                     except:
                         pass
             
-            self.results_tree.item(item, tags=current_tags)
+            # Ne repasser par Tk que si les tags ont réellement changé
+            if current_tags != original_tags:
+                self.results_tree.item(item, tags=current_tags)
         except:
             pass
 
     def _on_treeview_select_styled(self, event):
         """Gestion de la sélection avec style moderne."""
-        selection = self.results_tree.selection()
-        
-        # Réinitialiser tous les items
-        for item in self.results_tree.get_children():
-            current_tags = list(self.results_tree.item(item)['tags'])
-            if 'selected' in current_tags:
-                current_tags.remove('selected')
-            self.results_tree.item(item, tags=current_tags)
-        
+        tree = self.results_tree
+        selection = tree.selection()
+        new_selected = set(selection)
+
+        # Ne retoucher que les items dont l'état de sélection a changé
+        for item in self._selected_items - new_selected:
+            if tree.exists(item):
+                current_tags = list(tree.item(item, 'tags'))
+                if 'selected' in current_tags:
+                    current_tags.remove('selected')
+                    tree.item(item, tags=current_tags)
+
         # Appliquer le style de sélection
-        for item in selection:
-            current_tags = list(self.results_tree.item(item)['tags'])
+        for item in new_selected - self._selected_items:
+            current_tags = list(tree.item(item, 'tags'))
             if 'selected' not in current_tags:
                 current_tags.append('selected')
-            self.results_tree.item(item, tags=current_tags)
+                tree.item(item, tags=current_tags)
+
+        self._selected_items = new_selected
         
         # Traitement de la sélection
         for item in selection:
             item_data = self.results_tree.item(item)
             
             # Ne pas traiter les éléments de statut
-            if any(special in item_data['text'] for special in ['🔍 Recherche', 'Aucun résultat', 'Indexation']):
+            if item_data['text'].startswith(_SPECIAL_PREFIXES):
                 continue
             
             # Reconstituer les données (retirer l'icône du nom de fichier)
@@ -1621,12 +1737,8 @@ class FileSearchZoneView(ctk.CTkFrame):
             if file_name.startswith("📈 "):
                 file_name = file_name[2:]  # Retirer "📈 "
             
-            # Retrouver les données complètes depuis self.current_results
-            result_data = None
-            for result in self.current_results:
-                if result.get('file_name') == file_name:
-                    result_data = result
-                    break
+            # Retrouver les données complètes depuis les résultats courants
+            result_data = self._results_by_filename.get(file_name.strip())
             
             # Si on n'a pas trouvé les données complètes, reconstituer avec les données disponibles
             if result_data is None:
@@ -1646,29 +1758,33 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def display_search_results(self, results):
         """MODIFIÉ : Affiche les résultats selon le mode d'affichage actuel."""
-        print(f"DEBUG VUE: display_search_results appelée avec {len(results)} résultats en mode {self.current_display_mode}")
+        logger.debug("display_search_results : %d résultats en mode %s",
+                     len(results), self.current_display_mode)
         
         if threading.current_thread() != threading.main_thread():
-            print("WARNING: display_search_results appelée depuis un thread secondaire!")
+            logger.warning("display_search_results appelée depuis un thread secondaire")
             return
         
+        # Aucun résultat, comme déjà affiché : seul le compteur est à remettre
+        # à jour (l'indicateur de recherche a pu le remplacer)
+        if not results and not self.current_results:
+            self._update_results_count(0)
+            return
+
         # Stocker les résultats pour tous les modes
         self.current_results = results
+        self._results_revision += 1
+
+        # Index nom de fichier -> résultat (premier résultat en cas de doublon)
+        self._results_by_filename = {}
+        for result in results:
+            self._results_by_filename.setdefault((result.get('file_name') or '').strip(), result)
         
         # Mettre à jour le compteur de résultats
         self._update_results_count(len(results))
         
-        # Rafraîchir l'affichage selon le mode actuel
-        if self.current_display_mode == "list":
-            self._refresh_list_display()
-        elif self.current_display_mode == "group_by_date":
-            self._refresh_group_by_date_display()
-        elif self.current_display_mode == "group_by_folder":
-            self._refresh_group_by_folder_display()
-        elif self.current_display_mode == "group_by_location":
-            self._refresh_group_by_location_display()
-        
-        print("DEBUG VUE: Affichage terminé avec succès")
+        # Rafraîchir l'affichage selon le mode actuel (au prochain passage idle)
+        self._schedule_refresh()
 
     def _update_results_count(self, count):
         """Met à jour l'affichage du nombre de résultats."""
@@ -1686,12 +1802,11 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def on_indexing_completed(self, result):
         """Callback appelé quand l'indexation est terminée."""
-        print(f"DEBUG VUE: on_indexing_completed APPELÉE avec {result}")
+        logger.debug("on_indexing_completed : %s", result)
         
         try:
             # Marquer que l'indexation est terminée
             self.indexing_completed = True
-            print(f"DEBUG VUE: Flag indexing_completed mis à True")
             
             status_text = f"✅ Indexation terminée : {result.get('total_files', 0)} fichiers indexés"
             if result.get('from_cache'):
@@ -1710,10 +1825,8 @@ class FileSearchZoneView(ctk.CTkFrame):
                 text_color="#1565C0"
             ))
             
-            print(f"DEBUG VUE: Interface mise à jour, indexing_completed = {self.indexing_completed}")
-            
-        except Exception as e:
-            print(f"DEBUG VUE: ERREUR dans on_indexing_completed: {e}")
+        except Exception:
+            logger.exception("Erreur dans on_indexing_completed")
             # Forcer le flag même en cas d'erreur d'affichage
             self.indexing_completed = True
 
@@ -1728,26 +1841,29 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _on_search_changed(self, event):
         """Callback avec debounce pour la recherche."""
+        # Rien à faire tant que l'indexation n'est pas terminée
+        if not self.indexing_completed:
+            return
+
         search_text = self.search_entry.get()
-        print(f"DEBUG VUE: _on_search_changed appelée avec '{search_text}'")
-        print(f"DEBUG VUE: indexing_completed = {getattr(self, 'indexing_completed', False)}")
-        
-        # Vérification plus robuste
-        if not getattr(self, 'indexing_completed', False):
-            print("DEBUG VUE: Indexation pas terminée, recherche ignorée")
+
+        # Requête inchangée (flèches, Maj, ...) : la recherche programmée ou
+        # les résultats affichés restent valables
+        query = search_text.strip()
+        if query == self._last_query:
             return
+        self._last_query = query
         
         # Annuler la recherche précédente si elle existe
         if self.search_after_id is not None:
             self.after_cancel(self.search_after_id)
             self.search_after_id = None
         
-        # Afficher un indicateur de recherche en cours si le texte n'est pas vide
-        if search_text.strip():
+        if query:
+            # Afficher un indicateur de recherche en cours
             self._show_search_indicator()
-        
-        # Programmer la nouvelle recherche après le délai
-        if search_text.strip():
+
+            # Programmer la nouvelle recherche après le délai
             self.search_after_id = self.after(
                 self.search_delay, 
                 lambda: self._perform_delayed_search(search_text)
@@ -1758,7 +1874,7 @@ class FileSearchZoneView(ctk.CTkFrame):
 
     def _perform_delayed_search(self, search_text):
         """Effectue la recherche après le délai de debounce."""
-        print(f"DEBUG VUE: Recherche déclenchée après délai pour '{search_text}'")
+        logger.debug("Recherche déclenchée après délai pour '%s'", search_text)
         
         # Réinitialiser l'ID du timer
         self.search_after_id = None
@@ -1767,7 +1883,7 @@ class FileSearchZoneView(ctk.CTkFrame):
         if self.presenter:
             self.presenter.on_search_text_changed(search_text)
         else:
-            print("DEBUG VUE: ERREUR - Presenter n'existe pas!")
+            logger.warning("Recherche ignorée : aucun presenter associé à la vue")
 
     def _on_search_click(self):
         """Callback pour le clic sur le bouton de recherche."""
@@ -1778,8 +1894,12 @@ class FileSearchZoneView(ctk.CTkFrame):
         """Efface tous les résultats de recherche."""
         # Effacer selon le mode d'affichage
         if self.current_display_mode == "list" and hasattr(self, 'results_tree'):
-            for item in self.results_tree.get_children():
-                self.results_tree.delete(item)
+            children = self.results_tree.get_children()
+            if children:
+                self.results_tree.delete(*children)
+            self._selected_items = set()
+            # Le treeview ne montre plus les résultats courants
+            self._rendered_revision.pop("list", None)
         
         # Remettre le message approprié
         if self.indexing_completed:
@@ -1797,6 +1917,7 @@ class FileSearchZoneView(ctk.CTkFrame):
     def clear_search(self):
         """Efface le contenu du champ de recherche."""
         self.search_entry.delete(0, 'end')
+        self._last_query = None
 
     def focus_search_entry(self):
         """Met le focus sur le champ de recherche."""
@@ -1839,12 +1960,29 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         self._sort_reverse = False
         self._sorted_files = []  # Cache triée des fichiers
         self._hovered_item = None
+        self._rows = []  # Ordre d'affichage des iid (file_path), source de vérité
+        self._index_of = {}  # iid -> position dans self._rows
+        self._selected_items = set()  # Items portant actuellement le tag "selected"
+        self._editable_cols = self._get_editable_columns()
+        self._col_by_key = {c["key"]: c for c in self.COLUMNS_CONFIG if c["key"]}
+        self._detail_row_pool = []  # Lignes du panneau détail, réutilisées d'une sélection à l'autre
+        self._sel_after = None  # Identifiant du after() de mise à jour de sélection en attente
+        # Fenêtre racine, résolue au premier besoin (cf. _get_root). Ne pas
+        # nommer "_root" : l'attribut masquerait la méthode interne Misc._root().
+        self._toplevel = None
+        self._date_dialog = None  # Sélecteur de date, construit au premier affichage
         self._build_ui()
 
         self.model.raw_data_manager.subscribe(self._on_data_changed)
 
     # ──────────────────────── Construction UI ────────────────────────
 
+    def _get_root(self):
+        """Retourne la fenêtre racine (mise en cache après le premier appel)."""
+        if self._toplevel is None:
+            self._toplevel = self.winfo_toplevel()
+        return self._toplevel
+
     def _build_ui(self):
         """Construit toute l'interface du workspace données brutes."""
         # ─── En-tête bleu ───
@@ -1957,15 +2095,38 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
         # Événements
         self.tree.bind("<Button-3>", self._on_right_click)
-        self.tree.bind("<Delete>", self._on_delete_key)
         self.tree.bind("<Double-1>", self._on_double_click)
-        self.tree.bind("<<TreeviewSelect>>", self._on_selection_changed)
+        self.tree.bind("<<TreeviewSelect>>", self._schedule_selection_update)
         self.tree.bind("<Motion>", self._on_treeview_hover)
         self.tree.bind("<Leave>", self._on_treeview_leave)
-        self.tree.bind("<Up>", self._on_arrow_up)
-        self.tree.bind("<Down>", self._on_arrow_down)
-        self.tree.bind("<Left>", self._on_arrow_left)
-        self.tree.bind("<Right>", self._on_arrow_right)
+
+        # Touches clavier : un seul binding, aiguillage par keysym
+        self._key_handlers = {
+            "Delete": self._on_delete_key,
+            "Up": self._on_arrow_up,
+            "Down": self._on_arrow_down,
+            "Left": self._on_arrow_left,
+            "Right": self._on_arrow_right,
+        }
+        self.tree.bind("<KeyPress>", self._on_tree_key)
+
+        # Éditeur inline unique, repositionné sur la cellule à chaque édition
+        self._edit_entry = tk.Entry(
+            self.tree,
+            font=("Verdana", 12),
+            bd=2,
+            relief="solid",
+            highlightthickness=1,
+            highlightcolor="#1565C0",
+            highlightbackground="#90CAF9",
+        )
+        self._edit_entry.bind("<Return>", lambda e: self._confirm_edit())
+        self._edit_entry.bind("<Escape>", lambda e: self._cancel_edit())
+        self._edit_entry.bind("<FocusOut>", lambda e: self._on_edit_focus_out())
+        self._edit_entry.bind("<Up>", lambda e: self._nav_edit_vertical(-1))
+        self._edit_entry.bind("<Down>", lambda e: self._nav_edit_vertical(1))
+        self._edit_entry.bind("<Left>", lambda e: self._nav_edit_horizontal(-1, e))
+        self._edit_entry.bind("<Right>", lambda e: self._nav_edit_horizontal(1, e))
 
         # ─── Panneau détail (overrides) ───
         self._detail_frame = ctk.CTkFrame(self, fg_color="#FAFAFA", corner_radius=8,
@@ -2137,7 +2298,7 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             current_tags = list(self.tree.item(item)["tags"])
             if "hover" in current_tags:
                 current_tags.remove("hover")
-            if "selected" in current_tags:
+            if "selected" in current_tags and item not in self._selected_items:
                 current_tags.remove("selected")
             # Recalculer le tag de base si nécessaire
             base_tags = [t for t in current_tags
@@ -2223,7 +2384,10 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
     def _refresh_display(self):
         """Rafraîchit le treeview avec données terrain + corrections."""
-        self._cancel_edit()
+        # L'éditeur inline reste ouvert si son essai existe encore après reconstruction
+        edit_item = self._edit_item if self._edit_widget is self._edit_entry else None
+        if edit_item is None:
+            self._cancel_edit()
         rdm = self.model.raw_data_manager
         files = rdm.get_all_files()
         count = len(files)
@@ -2232,8 +2396,10 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
         prev_sel = self.tree.selection()
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self._rows = []
+        self._index_of = {}
+        self._selected_items = set()
 
         if count == 0:
             self.empty_label.lift()
@@ -2242,8 +2408,8 @@ class RawDataWorkspaceView(ctk.CTkFrame):
                 text="Sélectionnez un essai pour voir le détail des corrections.",
                 text_color="#9E9E9E")
             self._detail_frame.configure(fg_color="#FAFAFA", border_color="#E0E0E0")
-            for w in self._detail_overrides_frame.winfo_children():
-                w.destroy()
+            self._hide_detail_rows()
+            self._cancel_edit()
         else:
             self.empty_label.lower()
             sorted_files = self._get_sorted_files(files)
@@ -2264,38 +2430,63 @@ class RawDataWorkspaceView(ctk.CTkFrame):
                         # Colonnes d'unites : lire directement depuis file_data
                         values.append(f.get(col["key"], ""))
                     else:
-                        eff = rdm.get_effective_value(fp, col["key"])
+                        eff = str(rdm.get_effective_value(fp, col["key"]))
                         if rdm.has_override(fp, col["key"]):
-                            values.append(f"\u270E {eff}")
+                            values.append(_OV_PREFIX + eff)
                         else:
                             values.append(eff)
 
                 self.tree.insert("", "end", iid=fp, values=tuple(values), tags=(tag,))
+                self._index_of[fp] = len(self._rows)
+                self._rows.append(fp)
 
             for s in prev_sel:
                 if self.tree.exists(s):
                     self.tree.selection_add(s)
 
+            if edit_item is not None:
+                if self.tree.exists(edit_item):
+                    bbox = self.tree.bbox(edit_item, self._edit_col)
+                    if bbox:
+                        x, y, w, h = bbox
+                        self._edit_entry.place(x=x, y=y, width=w, height=h)
+                    else:
+                        # Ligne hors de la zone visible : l'éditeur resterait
+                        # au-dessus d'une autre ligne
+                        self._cancel_edit()
+                else:
+                    self._cancel_edit()
+
     # ──────────────────────── Panneau détail ────────────────────────
 
+    def _schedule_selection_update(self, event=None):
+        """Regroupe les événements de sélection rapprochés (shift-clic, clavier) en une seule mise à jour."""
+        if self._sel_after is not None:
+            self.after_cancel(self._sel_after)
+        self._sel_after = self.after(20, self._on_selection_changed)
+
     def _on_selection_changed(self, event=None):
         """Met à jour le panneau de détail et le style de sélection."""
+        self._sel_after = None
         # ── Style de sélection (identique à Recherche Rapide) ──
+        # Seules les lignes dont l'état de sélection a changé sont restylées.
         selection = self.tree.selection()
-        for item in self.tree.get_children():
-            current_tags = list(self.tree.item(item)["tags"])
-            if "selected" in current_tags:
-                current_tags.remove("selected")
-                self.tree.item(item, tags=current_tags)
-        for item in selection:
-            current_tags = list(self.tree.item(item)["tags"])
+        new_sel = set(selection)
+        for item in self._selected_items - new_sel:
+            if self.tree.exists(item):
+                current_tags = list(self.tree.item(item, "tags"))
+                if "selected" in current_tags:
+                    current_tags.remove("selected")
+                    self.tree.item(item, tags=current_tags)
+        for item in new_sel - self._selected_items:
+            current_tags = list(self.tree.item(item, "tags"))
             if "selected" not in current_tags:
                 current_tags.append("selected")
-            self.tree.item(item, tags=current_tags)
+                self.tree.item(item, tags=current_tags)
+        self._selected_items = new_sel
 
         # ── Nettoyage du panneau détail ──
-        for w in self._detail_overrides_frame.winfo_children():
-            w.destroy()
+        self._hide_detail_rows()
 
         if not selection:
             self._detail_icon.configure(text="ℹ️", text_color="#9E9E9E")
@@ -2308,8 +2499,9 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         fp = selection[0]
         rdm = self.model.raw_data_manager
         fname = rdm.get_original_value(fp, "file_name") or os.path.basename(fp)
+        overrides = rdm.get_overrides_snapshot(fp)
 
-        if not rdm.has_override(fp):
+        if not overrides:
             self._detail_icon.configure(text="✅", text_color="#66BB6A")
             self._detail_title.configure(
                 text=f"{fname} — données terrain originales (aucune correction)",
@@ -2324,40 +2516,65 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             text_color="#E65100")
         self._detail_frame.configure(fg_color="#FFF8E1", border_color="#FFE082")
 
-        for col in self.COLUMNS_CONFIG:
-            if col["key"] is None:
-                continue
-            if not rdm.has_override(fp, col["key"]):
+        count = 0
+        for key, (orig, corr) in overrides.items():
+            col = self._col_by_key.get(key)
+            if col is None:
                 continue
 
-            orig = rdm.get_original_value(fp, col["key"]) or "(vide)"
-            corr = rdm.get_effective_value(fp, col["key"]) or "(vide)"
-
+            entry = self._get_detail_row(count)
+            entry["label_field"].configure(text=f"  {col['text']} :")
+            entry["label_orig"].configure(text=orig or "(vide)")
+            entry["label_corr"].configure(text=corr or "(vide)")
+            entry["row"].pack(fill="x", pady=1)
+            count += 1
+
+    def _get_detail_row(self, index):
+        """Retourne la ligne n° index du pool du panneau détail (créée au premier besoin)."""
+        pool = self._detail_row_pool
+        while len(pool) <= index:
             row = ctk.CTkFrame(self._detail_overrides_frame, fg_color="transparent")
-            row.pack(fill="x", pady=1)
 
-            ctk.CTkLabel(
-                row, text=f"  {col['text']} :",
+            label_field = ctk.CTkLabel(
+                row, text="",
                 font=("Verdana", 11, "bold"), text_color="#5D4037",
                 width=90, anchor="e",
-            ).pack(side="left")
+            )
+            label_field.pack(side="left")
 
-            ctk.CTkLabel(
-                row, text=orig,
+            label_orig = ctk.CTkLabel(
+                row, text="",
                 font=("Verdana", 11), text_color="#9E9E9E",
                 anchor="w",
-            ).pack(side="left", padx=(6, 0))
+            )
+            label_orig.pack(side="left", padx=(6, 0))
 
-            ctk.CTkLabel(
+            arrow = ctk.CTkLabel(
                 row, text="→",
                 font=("Verdana", 12, "bold"), text_color="#E65100",
-            ).pack(side="left", padx=6)
+            )
+            arrow.pack(side="left", padx=6)
 
-            ctk.CTkLabel(
-                row, text=corr,
+            label_corr = ctk.CTkLabel(
+                row, text="",
                 font=("Verdana", 11, "bold"), text_color="#E65100",
                 anchor="w",
-            ).pack(side="left")
+            )
+            label_corr.pack(side="left")
+
+            pool.append({
+                "row": row,
+                "label_field": label_field,
+                "label_orig": label_orig,
+                "arrow": arrow,
+                "label_corr": label_corr,
+            })
+        return pool[index]
+
+    def _hide_detail_rows(self):
+        """Masque toutes les lignes du panneau détail sans les détruire."""
+        for entry in self._detail_row_pool:
+            entry["row"].pack_forget()
 
     # ──────────────────────── Édition inline ────────────────────────
 
@@ -2383,7 +2600,7 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             self._start_inline_edit(item, col, col_cfg["key"])
 
     def _start_inline_edit(self, item, col, field_key):
-        """Crée un Entry widget superposé à la cellule pour l'édition."""
+        """Superpose l'éditeur inline à la cellule pour l'édition."""
         self._cancel_edit()
 
         try:
@@ -2397,15 +2614,8 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         rdm = self.model.raw_data_manager
         current_value = rdm.get_effective_value(item, field_key)
 
-        entry = tk.Entry(
-            self.tree,
-            font=("Verdana", 12),
-            bd=2,
-            relief="solid",
-            highlightthickness=1,
-            highlightcolor="#1565C0",
-            highlightbackground="#90CAF9",
-        )
+        entry = self._edit_entry
+        entry.delete(0, tk.END)
         entry.insert(0, current_value)
         entry.select_range(0, tk.END)
         entry.place(x=x, y=y, width=w, height=h)
@@ -2416,14 +2626,6 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         self._edit_field = field_key
         self._edit_col = col
 
-        entry.bind("<Return>", lambda e: self._confirm_edit())
-        entry.bind("<Escape>", lambda e: self._cancel_edit())
-        entry.bind("<FocusOut>", lambda e: self._on_edit_focus_out())
-        entry.bind("<Up>", lambda e: self._nav_edit_vertical(-1))
-        entry.bind("<Down>", lambda e: self._nav_edit_vertical(1))
-        entry.bind("<Left>", lambda e: self._nav_edit_horizontal(-1, e))
-        entry.bind("<Right>", lambda e: self._nav_edit_horizontal(1, e))
-
     def _confirm_edit(self):
         """Valide la correction inline."""
         if not self._edit_widget:
@@ -2440,16 +2642,20 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         self.model.raw_data_manager.set_override(fp, field, new_value)
 
     def _cancel_edit(self):
-        """Annule l'édition inline en cours."""
+        """Annule l'édition inline en cours (l'Entry persistant est masqué, le Combobox détruit)."""
         if self._edit_widget:
-            try:
-                self._edit_widget.destroy()
-            except Exception:
-                pass
+            widget = self._edit_widget
             self._edit_widget = None
             self._edit_item = None
             self._edit_field = None
             self._edit_col = None
+            try:
+                if widget is self._edit_entry:
+                    widget.place_forget()
+                else:
+                    widget.destroy()
+            except Exception:
+                pass
 
     # ──────────────────────── Dropdown unite ────────────────────────
 
@@ -2498,13 +2704,19 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
     # ──────────────────────── Navigation clavier ────────────────────────
 
+    def _on_tree_key(self, event):
+        """Aiguille les touches du Treeview vers leur gestionnaire."""
+        handler = self._key_handlers.get(event.keysym)
+        if handler is not None:
+            return handler(event)
+
     def _get_editable_columns(self):
         """Retourne la liste des indices de colonnes éditables (1-based, format treeview)."""
         return [i + 1 for i, col in enumerate(self.COLUMNS_CONFIG) if col["key"] is not None]
 
     def _on_edit_focus_out(self):
-        """Gère la perte de focus de l'éditeur inline (ignore si navigation en cours)."""
-        if getattr(self, "_navigating", False):
+        """Gère la perte de focus de l'éditeur inline (ignorée si l'éditeur est masqué)."""
+        if not self._edit_entry.winfo_viewable():
             return
         self._confirm_edit()
 
@@ -2517,23 +2729,16 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         current_field = self._edit_field
 
         # Confirmer l'édition courante
-        self._navigating = True
         self._confirm_edit()
 
         # Trouver l'item adjacent
-        children = self.tree.get_children()
-        if not children:
-            self._navigating = False
-            return
-        try:
-            idx = list(children).index(current_item)
-        except ValueError:
-            self._navigating = False
+        children = self._rows
+        idx = self._index_of.get(current_item)
+        if idx is None:
             return
 
         new_idx = idx + direction
         if new_idx < 0 or new_idx >= len(children):
-            self._navigating = False
             return
 
         new_item = children[new_idx]
@@ -2542,7 +2747,7 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         self.tree.focus(new_item)
 
         # Ouvrir l'éditeur sur le même champ de la nouvelle ligne
-        self.after(10, lambda: self._deferred_open_edit(new_item, current_col, current_field))
+        self._start_inline_edit(new_item, current_col, current_field)
 
     def _nav_edit_horizontal(self, direction, event=None):
         """Navigation horizontale (gauche/droite) pendant l'édition : passe au champ éditable adjacent."""
@@ -2562,7 +2767,7 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
         # Trouver la colonne courante et la suivante/précédente éditable
         current_col_idx = int(current_col.replace("#", ""))
-        editable_cols = self._get_editable_columns()
+        editable_cols = self._editable_cols
 
         try:
             pos = editable_cols.index(current_col_idx)
@@ -2577,28 +2782,20 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         new_field = self.COLUMNS_CONFIG[new_col_idx - 1]["key"]
 
         # Confirmer l'édition courante et ouvrir la nouvelle
-        self._navigating = True
         self._confirm_edit()
-        self.after(10, lambda: self._deferred_open_edit(current_item, new_col, new_field))
-
-    def _deferred_open_edit(self, item, col, field_key):
-        """Ouvre l'éditeur inline après un court délai (pour laisser le rafraîchissement se faire)."""
-        self._navigating = False
-        if self.tree.exists(item):
-            self._start_inline_edit(item, col, field_key)
+        self._start_inline_edit(current_item, new_col, new_field)
 
     def _on_arrow_up(self, event):
         """Flèche haut sans édition : déplace la sélection vers le haut."""
         if self._edit_widget:
             return  # Géré par les bindings de l'entry
-        children = self.tree.get_children()
+        children = self._rows
         if not children:
             return
         sel = self.tree.selection()
         if sel:
-            try:
-                idx = list(children).index(sel[0])
-            except ValueError:
+            idx = self._index_of.get(sel[0])
+            if idx is None:
                 return
             if idx > 0:
                 self.tree.selection_set(children[idx - 1])
@@ -2613,14 +2810,13 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         """Flèche bas sans édition : déplace la sélection vers le bas."""
         if self._edit_widget:
             return
-        children = self.tree.get_children()
+        children = self._rows
         if not children:
             return
         sel = self.tree.selection()
         if sel:
-            try:
-                idx = list(children).index(sel[0])
-            except ValueError:
+            idx = self._index_of.get(sel[0])
+            if idx is None:
                 return
             if idx < len(children) - 1:
                 self.tree.selection_set(children[idx + 1])
@@ -2669,9 +2865,10 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         # Reutiliser l'entree existante de la vue FILTRER si disponible
         # (pour conserver l'etat is_filtered et le cache df_filtered)
         entry = None
-        app_view = self.winfo_toplevel()
-        if hasattr(app_view, 'cleaning_view'):
-            for e in app_view.cleaning_view.cpt_entries:
+        app_view = self._get_root()
+        cleaning_view = getattr(app_view, 'cleaning_view', None)
+        if cleaning_view is not None:
+            for e in cleaning_view.cpt_entries:
                 if e.file_path == file_path:
                     entry = e
                     break
@@ -2686,27 +2883,41 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
     def show_date_picker(self):
         """Affiche un sélecteur de date et applique la date aux essais sélectionnés."""
-        from tkcalendar import Calendar
-        import datetime
-
         rdm = self.model.raw_data_manager
         if rdm.count == 0:
             return
+        if Calendar is None:
+            logger.warning("Sélecteur de date indisponible : le module tkcalendar n'est pas installé")
+            return
 
-        root = self.winfo_toplevel()
-        dialog = ctk.CTkToplevel(root)
-        dialog.title("Date des essais")
-        dialog.resizable(False, False)
-        dialog.grab_set()
-        dialog.transient(root)
+        root = self._get_root()
+        # La fenêtre est construite une seule fois puis masquée/réaffichée
+        if self._date_dialog is None or not self._date_dialog.winfo_exists():
+            self._build_date_picker(root)
+        else:
+            self._date_dialog.deiconify()
+        dialog = self._date_dialog
 
         # Dimensions et centrage
         w, h = 380, 420
-        dialog.geometry(f"{w}x{h}")
-        dialog.update_idletasks()
         x = root.winfo_x() + (root.winfo_width() - w) // 2
         y = root.winfo_y() + (root.winfo_height() - h) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.geometry(f"{w}x{h}+{x}+{y}")
+        dialog.grab_set()
+
+        # Indication et date du jour
+        self._date_info_label.configure(text=f"Sera appliquée à tous les {rdm.count} essai(s).")
+        today = datetime.date.today()
+        self._date_cal.selection_set(today)
+        self._date_cal.see(today)
+
+    def _build_date_picker(self, root):
+        """Construit la fenêtre du sélecteur de date (appelé au premier affichage)."""
+        dialog = ctk.CTkToplevel(root)
+        dialog.title("Date des essais")
+        dialog.resizable(False, False)
+        dialog.transient(root)
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_date_picker)
 
         frame = ctk.CTkFrame(dialog, fg_color="#FFFFFF", corner_radius=0)
         frame.pack(fill="both", expand=True)
@@ -2722,24 +2933,24 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             text_color="white",
         ).pack(padx=15, pady=10)
 
-        # Indication
-        info_text = f"Sera appliquée à tous les {rdm.count} essai(s)."
-
-        ctk.CTkLabel(
+        # Indication (texte mis à jour à chaque affichage)
+        self._date_info_label = ctk.CTkLabel(
             frame,
-            text=info_text,
+            text="",
             font=("Verdana", 11, "italic"),
             text_color="#757575",
-        ).pack(pady=(10, 5))
+        )
+        self._date_info_label.pack(pady=(10, 5))
 
         # Calendrier
-        cal = Calendar(
+        today = datetime.date.today()
+        self._date_cal = Calendar(
             frame,
             selectmode="day",
             date_pattern="dd/mm/yyyy",
-            year=datetime.date.today().year,
-            month=datetime.date.today().month,
-            day=datetime.date.today().day,
+            year=today.year,
+            month=today.month,
+            day=today.day,
             font=("Verdana", 12),
             background="#0115B8",
             foreground="white",
@@ -2755,18 +2966,17 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             othermonthforeground="#BDBDBD",
             othermonthweforeground="#BDBDBD",
         )
-        cal.pack(padx=20, pady=10, fill="both", expand=True)
+        self._date_cal.pack(padx=20, pady=10, fill="both", expand=True)
 
         # Boutons
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
         btn_frame.pack(pady=(5, 15))
 
         def do_apply():
-            selected_date = cal.get_date()
+            selected_date = self._date_cal.get_date()
             # Appliquer à tous les essais
-            for fp in rdm.get_file_paths():
-                rdm.set_override(fp, "Date", selected_date)
-            dialog.destroy()
+            self.model.raw_data_manager.set_override_bulk("Date", selected_date)
+            self._hide_date_picker()
 
         ctk.CTkButton(
             btn_frame,
@@ -2791,9 +3001,17 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             corner_radius=8,
             width=120,
             height=36,
-            command=dialog.destroy,
+            command=self._hide_date_picker,
         ).pack(side="left", padx=10)
 
+        self._date_dialog = dialog
+
+    def _hide_date_picker(self):
+        """Masque le sélecteur de date sans le détruire (réutilisé au prochain affichage)."""
+        if self._date_dialog is not None and self._date_dialog.winfo_exists():
+            self._date_dialog.grab_release()
+            self._date_dialog.withdraw()
+
     # ──────────────────────── Menu contextuel ────────────────────────
 
     def _on_right_click(self, event):
@@ -2803,7 +3021,7 @@ class RawDataWorkspaceView(ctk.CTkFrame):
             return
         self.tree.selection_set(item)
 
-        root = self.winfo_toplevel()
+        root = self._get_root()
         menu = ctk.CTkFrame(root, fg_color="#FFFFFF", corner_radius=6,
                             border_width=1, border_color="#D0D0D0")
 
@@ -2873,44 +3091,47 @@ class RawDataWorkspaceView(ctk.CTkFrame):
                    y=event.y_root - root.winfo_rooty())
         menu.lift()
 
-        def _close(e):
-            try:
-                mx, my = e.x_root, e.y_root
-                wx = menu.winfo_rootx()
-                wy = menu.winfo_rooty()
-                ww = menu.winfo_width()
-                wh = menu.winfo_height()
-                if wx <= mx <= wx + ww and wy <= my <= wy + wh:
-                    return
-            except Exception:
-                pass
+        # Grab local : les clics hors du menu sont redirigés vers le menu lui-même,
+        # ce qui évite un binding global <Button-1> sur la fenêtre racine.
+        def _grab():
             try:
                 if menu.winfo_exists():
-                    menu.destroy()
-            except Exception:
-                pass
-            try:
-                root.unbind("<Button-1>", cid)
-            except Exception:
+                    menu.grab_set()
+                    menu.focus_set()
+            except tk.TclError:
                 pass
 
-        cid = root.bind("<Button-1>", _close, add="+")
+        def _close(e):
+            if 0 <= e.x < menu.winfo_width() and 0 <= e.y < menu.winfo_height():
+                return
+            self._close_context_menu(menu)
 
-    def _ctx_apply_to_all(self, menu, field, value, field_label):
-        """Applique une valeur à tous les essais après confirmation."""
+        # tk.Misc.bind : CTkFrame.bind lierait le canvas interne, alors que le
+        # grab redirige les clics extérieurs vers la fenêtre Tk du frame
+        tk.Misc.bind(menu, "<Button-1>", _close)
+        tk.Misc.bind(menu, "<Escape>", lambda e: self._close_context_menu(menu))
+        menu.after_idle(_grab)
+
+    def _close_context_menu(self, menu):
+        """Libère le grab du menu contextuel puis le détruit."""
         try:
             if menu.winfo_exists():
+                menu.grab_release()
                 menu.destroy()
-        except Exception:
+        except tk.TclError:
             pass
 
+    def _ctx_apply_to_all(self, menu, field, value, field_label):
+        """Applique une valeur à tous les essais après confirmation."""
+        self._close_context_menu(menu)
+
         rdm = self.model.raw_data_manager
         count = rdm.count
         if count == 0:
             return
 
         # Fenêtre de confirmation
-        root = self.winfo_toplevel()
+        root = self._get_root()
         confirm = ctk.CTkToplevel(root)
         confirm.title("Confirmation")
         confirm.resizable(False, False)
@@ -2919,11 +3140,9 @@ class RawDataWorkspaceView(ctk.CTkFrame):
 
         # Centrage
         w, h = 480, 200
-        confirm.geometry(f"{w}x{h}")
-        confirm.update_idletasks()
         x = root.winfo_x() + (root.winfo_width() - w) // 2
         y = root.winfo_y() + (root.winfo_height() - h) // 2
-        confirm.geometry(f"+{x}+{y}")
+        confirm.geometry(f"{w}x{h}+{x}+{y}")
 
         frame = ctk.CTkFrame(confirm, fg_color="#FFFFFF", corner_radius=0)
         frame.pack(fill="both", expand=True)
@@ -2947,8 +3166,7 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         btn_frame.pack(pady=(0, 15))
 
         def do_apply():
-            for fp in rdm.get_file_paths():
-                rdm.set_override(fp, field, value)
+            rdm.set_override_bulk(field, value)
             confirm.destroy()
 
         ctk.CTkButton(
@@ -2978,19 +3196,11 @@ class RawDataWorkspaceView(ctk.CTkFrame):
         ).pack(side="left", padx=10)
 
     def _ctx_reset_overrides(self, menu, item):
-        try:
-            if menu.winfo_exists():
-                menu.destroy()
-        except Exception:
-            pass
+        self._close_context_menu(menu)
         self.model.raw_data_manager.reset_overrides(item)
 
     def _ctx_remove(self, menu, item):
-        try:
-            if menu.winfo_exists():
-                menu.destroy()
-        except Exception:
-            pass
+        self._close_context_menu(menu)
         self.model.raw_data_manager.remove_file(item)
 
 
@@ -2998,11 +3208,29 @@ class AppView(ctk.CTk):
     """
     Fenêtre principale de l'application avec splash screen intelligent.
     """
+    # Nombre maximal de mises à jour GUI traitées par passage de la boucle Tk
+    _GUI_UPDATE_BATCH = 200
+    # Nombre de dégradés (PhotoImage) conservés pour les tailles récentes
+    _GRADIENT_CACHE_SIZE = 4
+    # Workspace qui construit chaque vue (voir get_view)
+    _VIEW_WORKSPACES = {
+        "home_view": "ACCUEIL",
+        "raw_data_view": "DONNÉES BRUTES",
+        "cleaning_view": "FILTRER",
+        "observations_view": "OBSERVATIONS",
+        "cotes_view": "COTES",
+        "traiter_view": "CALCULER",
+        "quick_search_zone": "RECHERCHE RAPIDE",
+        "settings_view": "PREFERENCES",
+    }
+
     def __init__(self, model, presenter):
         super().__init__()
         self.model = model
         self.presenter = presenter
         self._closing = False
+        self._batching = False  # Vrai pendant le traitement d'un lot de mises à jour GUI
+        self._drain_scheduled = False  # Vrai si un poll_gui_updates est déjà planifié
 
         # Initialiser le thème clam une seule fois pour tous les Treeview
         style = ttk.Style()
@@ -3017,6 +3245,48 @@ class AppView(ctk.CTk):
         self.configure(bg=self.model.window_bg_color)
         self.gradient_image = None
         self.gradient_tk_image = None
+        self._gradient_cache_key = None  # (largeur, hauteur, couleur1, couleur2, ratio) du dégradé affiché
+        self._gradient_images = OrderedDict()  # Derniers PhotoImage générés, par clé (LRU)
+        self._gradient_canvas_item = None  # Item image du dégradé sur le canvas
+        self._last_window_size = None  # Dernière taille (w, h) vue dans on_resize
+        self._resize_after_id = None  # Redessin du dégradé en attente (debounce)
+        # Génération des images de dégradé hors du thread Tk
+        self._gradient_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._gradient_pending_key = None  # Clé du dégradé en cours de génération
+
+        # Widgets créés plus tard (splash puis interface principale)
+        self.splash_frame = None
+        self.splash_label = None
+        self.splash_label_software_name = None
+        self.splash_progress_bar = None
+        self.splash_progress_label = None
+        self._splash_bar_exists = False
+        self._last_splash_pct = -1.0  # Dernier pourcentage affiché sur le splash
+        self._last_splash_paint = 0.0  # Instant (monotonic) du dernier affichage
+        self._real_progress_received = False  # Vrai dès qu'une progression réelle arrive
+        self._splash_t0 = 0.0  # Instant de départ de l'animation du splash
+        self._splash_after_id = None  # Prochain tick de l'animation du splash
+        self._splash_stopped = False  # Vrai dès que le splash n'est plus affiché
+        self.quick_search_zone = None
+
+        # Vues de l'interface principale, créées par load_main_interface ou
+        # à la première ouverture de leur workspace
+        self.top_menu_view = None
+        self.side_menu_view = None
+        self.home_view = None
+        self.raw_data_view = None
+        self.cleaning_view = None
+        self.observations_view = None
+        self.cotes_view = None
+        self.traiter_view = None
+        self.settings_view = None
+
+        # Workspaces construits à la demande (voir create_workspaces)
+        self.workspaces = {}
+        self._workspace_builders = {}
+        self._workspace_hooks = {}  # Nom -> vue notifiée (on_workspace_shown / on_workspace_hidden)
+        self._current_workspace = None
+        self._current_workspace_name = None
 
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -3025,47 +3295,80 @@ class AppView(ctk.CTk):
 
         # Démarrer les timers
         self.after(self.model.splash_screen_delay, self._on_min_splash_time_elapsed)
+
+        # Mises à jour GUI pilotées par événement : le modèle réveille la vue
+        # à chaque mise à jour postée. Une lecture initiale récupère ce qui a
+        # pu être posté avant le démarrage de la boucle Tk.
+        self.model.register_gui_callback(self._on_gui_update_posted)
         self.after(100, self.poll_gui_updates)
 
     def _on_min_splash_time_elapsed(self):
         """Marque que le temps minimum du splash screen est écoulé."""
-        print("DEBUG SPLASH: Temps minimum écoulé")
+        logger.debug("Splash : temps minimum écoulé")
         self.splash_min_time_elapsed = True
         self._check_ready_to_load_interface()
 
     def _on_indexing_completed_splash(self, result):
         """Gère la fin d'indexation pendant le splash screen."""
-        print(f"DEBUG SPLASH: Indexation terminée - {result}")
+        logger.debug("Splash : indexation terminée - %s", result)
         self.indexing_completed = True
+
+        self._stop_splash_animation()
+        self._complete_splash_progress()
         self._check_ready_to_load_interface()
 
+    def _complete_splash_progress(self):
+        """Complète la barre de progression du splash à 100%."""
+        if not self._splash_bar_exists:
+            return
+        try:
+            self.splash_progress_bar.set(1.0)
+            if self.splash_progress_label is not None:
+                self.splash_progress_label.configure(text="Indexation terminée !")
+        except tk.TclError:
+            pass
+
     def _check_ready_to_load_interface(self):
         """Vérifie si on peut charger l'interface principale."""
         if self.splash_min_time_elapsed and self.indexing_completed and not self.interface_ready:
-            print("DEBUG SPLASH: Conditions remplies, chargement de l'interface")
+            logger.debug("Splash : conditions remplies, chargement de l'interface")
             self.interface_ready = True
             self.load_main_interface()
 
     def _update_splash_progress(self, progress_data):
         """Met à jour la barre de progression avec les vraies données."""
-        if not hasattr(self, 'splash_progress_bar') or not self.splash_progress_bar.winfo_exists():
+        # Après la fin de l'indexation, la barre reste sur "Indexation terminée !"
+        if not self._splash_bar_exists or self.indexing_completed:
             return
             
         try:
-            self._real_progress_received = True
+            if not self._real_progress_received:
+                # La vraie progression remplace l'animation : plus de ticks
+                self._real_progress_received = True
+                self._stop_splash_animation()
             
             current = progress_data.get("current", 0)
             total = progress_data.get("total", 100)
             percentage = progress_data.get("percentage", 0)
-            
-            #print(f"DEBUG PROGRESS: {current}/{total} = {percentage:.1f}%")
+
+            # Redessiner si la progression a avancé d'au moins 0,5 % ou si
+            # 100 ms se sont écoulées (le compteur de fichiers ne reste pas
+            # figé sur un index lent) ; la fin est affichée une seule fois
+            if percentage == self._last_splash_pct:
+                return
+            now = time.monotonic()
+            if (percentage - self._last_splash_pct < 0.5 and percentage < 100
+                    and now - self._last_splash_paint < 0.1):
+                return
+            self._last_splash_pct = percentage
+            self._last_splash_paint = now
             
             # Mettre à jour la barre de progression
             progress_value = min(percentage / 100.0, 1.0)
             self.splash_progress_bar.set(progress_value)
             
             # Mettre à jour le texte
-            if hasattr(self, 'splash_progress_label'):
+            if self.splash_progress_label is not None:
                 if total > 0:
                     self.splash_progress_label.configure(
                         text=f"Indexation : {current}/{total} fichiers ({percentage:.1f}%)"
@@ -3073,42 +3376,68 @@ class AppView(ctk.CTk):
                 else:
                     self.splash_progress_label.configure(text="Initialisation...")
             
-            # Forcer la mise à jour de l'affichage
-            self.splash_progress_bar.update_idletasks()
-            
-        except Exception as e:
-            print(f"Erreur lors de la mise à jour de progression : {e}")
+        except Exception:
+            logger.exception("Erreur lors de la mise à jour de progression")
 
     def schedule_gui_update(self, update_function):
         """Programme une mise à jour GUI dans le thread principal."""
         self.after(0, update_function)
 
+    def _on_gui_update_posted(self):
+        """Callback du modèle (thread d'indexation) : planifie la lecture de la queue GUI."""
+        if self._closing or self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        try:
+            self.after(0, self.poll_gui_updates)
+        except (RuntimeError, tk.TclError):
+            # Boucle Tk pas encore active : la prochaine mise à jour réessaiera
+            self._drain_scheduled = False
+
     def poll_gui_updates(self):
-        """Version modifiée pour gérer la progression réelle pendant le splash."""
+        """Traite les mises à jour GUI en attente (progression réelle pendant le splash)."""
+        self._drain_scheduled = False
         if self._closing:
             return
+        if self._batching:
+            # Un lot est déjà en cours de traitement : relire la queue une fois terminé
+            self._drain_scheduled = True
+            self.after_idle(self.poll_gui_updates)
+            return
             
+        self._batching = True
+        updates = []
         try:
-            updates = self.model.get_gui_updates()
+            updates = self.model.get_gui_updates(max_items=self._GUI_UPDATE_BATCH)
+            # Seule la progression la plus récente du lot est affichée
+            last_progress = None
             
             for update_type, data in updates:
                 if update_type == "indexing_progress":
-                    self._update_splash_progress(data)
-                    
-                elif update_type == "indexing_completed":
+                    last_progress = data
+                    continue
+
+                # Appliquer la progression en attente avant un événement de fin,
+                # pour qu'elle n'écrase pas ensuite "Indexation terminée !"
+                if last_progress is not None:
+                    self._update_splash_progress(last_progress)
+                    last_progress = None
+
+                if update_type == "indexing_completed":
                     if not self.interface_ready:
                         # Pendant le splash screen
                         self._on_indexing_completed_splash(data)
                     else:
                         # Interface déjà chargée
-                        if hasattr(self, 'quick_search_zone'):
+                        if self.quick_search_zone is not None:
                             self.quick_search_zone.on_indexing_completed(data)
                             
                             # Afficher les fichiers de la date la plus récente
                             latest_files = self.model.get_latest_date_files()
                             if latest_files:
                                 self.quick_search_zone.display_search_results(latest_files)
-                                print(f"DEBUG: Affichage de {len(latest_files)} fichiers de la date la plus récente après indexation")
+                                logger.debug("Affichage de %d fichiers de la date la plus récente après indexation",
+                                             len(latest_files))
                                 
                                 # Mettre à jour le message après affichage
                                 def update_message():
@@ -3121,28 +3450,40 @@ class AppView(ctk.CTk):
                                 self.after(2000, update_message)
                             
                 elif update_type == "indexing_error":
-                    print(f"GUI: Erreur d'indexation - {data}")
+                    logger.error("Erreur d'indexation - %s", data)
                     # En cas d'erreur, on charge quand même l'interface
                     if not self.interface_ready:
                         self.indexing_completed = True
                         self._check_ready_to_load_interface()
+
+            if last_progress is not None:
+                self._update_splash_progress(last_progress)
                         
-        except Exception as e:
-            print(f"Erreur lors du polling GUI : {e}")
-        
-        # Continuer le polling
-        if not self._closing:
-            self.after(100, self.poll_gui_updates)
+        except Exception:
+            logger.exception("Erreur lors du polling GUI")
+        finally:
+            self._batching = False
+
+        # Lot plein : la queue n'est peut-être pas vide, reprendre au prochain
+        # passage idle pour laisser la boucle Tk respirer entre deux lots
+        if len(updates) >= self._GUI_UPDATE_BATCH and not self._drain_scheduled and not self._closing:
+            self._drain_scheduled = True
+            self.after_idle(self.poll_gui_updates)
 
     def on_closing(self):
         """Méthode appelée lors de la fermeture de l'application."""
         self._closing = True
+        self._stop_splash_animation()
 
-        # Nettoyer les ressources si nécessaire
-        if hasattr(self, 'gradient_image'):
-            self.gradient_image = None
-        if hasattr(self, 'gradient_tk_image'):
-            self.gradient_tk_image = None
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        self._gradient_executor.shutdown(wait=False)
+
+        # Nettoyer les ressources
+        self.gradient_image = None
+        self.gradient_tk_image = None
+        self._gradient_images.clear()
 
         # Fermer l'application
         self.destroy()
@@ -3200,83 +3541,69 @@ class AppView(ctk.CTk):
         )
         self.splash_progress_bar.place(relx=0.5, rely=0.7, anchor="center")
         self.splash_progress_bar.set(0)
+        self._splash_bar_exists = True
         
         # Animation de la barre de progression
+        self._splash_t0 = time.monotonic()
         self._animate_splash_progress()
 
     def _animate_splash_progress(self):
         """Animation qui ne conflite pas avec la progression réelle."""
-        if not self.interface_ready and hasattr(self, 'splash_progress_bar'):
-            try:
-                if self.indexing_completed:
-                    # Compléter à 100% quand l'indexation est terminée
-                    self.splash_progress_bar.set(1.0)
-                    if hasattr(self, 'splash_progress_label'):
-                        self.splash_progress_label.configure(text="Indexation terminée !")
-                    return
-                
-                # Ne faire l'animation que si aucune progression réelle n'est reçue
-                if not hasattr(self, '_real_progress_received'):
-                    self._real_progress_received = False
-                
-                if not self._real_progress_received:
-                    # Animation de va-et-vient seulement si pas de vraie progression
-                    current_progress = self.splash_progress_bar.get()
-                    
-                    if not hasattr(self, 'progress_direction'):
-                        self.progress_direction = 1
-                    
-                    new_progress = current_progress + (0.03 * self.progress_direction)
-                    
-                    if new_progress >= 0.8:  # Ne pas aller jusqu'à 100% en mode animation
-                        self.progress_direction = -1
-                    elif new_progress <= 0:
-                        self.progress_direction = 1
-                    
-                    self.splash_progress_bar.set(new_progress)
-                
-                # Continuer l'animation
-                if not self.indexing_completed:
-                    self.after(150, self._animate_splash_progress)
-                    
-            except:
-                pass
+        self._splash_after_id = None
+        if self.indexing_completed:
+            # Indexation terminée avant la création du splash (cache)
+            self._complete_splash_progress()
+            return
+        if (self._splash_stopped or self.interface_ready
+                or self._real_progress_received or not self._splash_bar_exists):
+            return
+        try:
+            # Animation de va-et-vient tant qu'aucune vraie progression n'est
+            # reçue (la première l'arrête, comme la fin de l'indexation).
+            # La position dépend du temps écoulé et non du nombre de ticks :
+            # un tick en retard ne ralentit pas le mouvement.
+            t = time.monotonic() - self._splash_t0
+            # Oscille entre 0 et 0.8 (jamais 100% en mode animation)
+            self.splash_progress_bar.set(0.4 * (1 - math.cos(t * math.pi / 4.0)))
+
+            # Continuer l'animation
+            self._splash_after_id = self.after(50, self._animate_splash_progress)
+        except (tk.TclError, AttributeError):
+            pass
+
+    def _stop_splash_animation(self):
+        """Arrête définitivement l'animation du splash."""
+        self._splash_stopped = True
+        if self._splash_after_id is not None:
+            self.after_cancel(self._splash_after_id)
+            self._splash_after_id = None
+
+    def _destroy_splash_screen(self):
+        """Détruit les widgets du splash : ils ne resservent plus une fois l'interface chargée."""
+        self._splash_bar_exists = False
+        if self.splash_frame is not None:
+            self.splash_frame.destroy()
+        self.splash_frame = None
+        self.splash_label = None
+        self.splash_label_software_name = None
+        self.splash_progress_label = None
+        self.splash_progress_bar = None
 
     def load_main_interface(self):
         """Charge l'interface principale avec indexation déjà terminée."""
-        print("DEBUG SPLASH: Chargement de l'interface principale")
-        self.splash_frame.place_forget()
+        logger.debug("Splash : chargement de l'interface principale")
+        self._stop_splash_animation()
+        self._destroy_splash_screen()
 
         # Création des composants principaux de l'interface
         self.top_menu_view = TopMenuView(self, self.model, self.presenter)
         self.side_menu_view = SideMenuView(self, self.model, self.presenter)
 
-        # Création de l'espace de travail principal et des workspaces
+        # Création de l'espace de travail principal ; les workspaces sont
+        # construits à la demande par display_workspace
         self.create_main_workspace_frame()
         self.create_workspaces(self.main_workspace_frame)
 
-        # L'indexation est déjà terminée, marquer le flag pour quick_search_zone
-        if hasattr(self, 'quick_search_zone'):
-            self.quick_search_zone.indexing_completed = True
-            
-            # Afficher l'intégralité des fichiers indexés
-            all_files = self.model.get_all_indexed_files()
-            if all_files:
-                self.quick_search_zone.display_search_results(all_files)
-                print(f"DEBUG: Affichage de {len(all_files)} fichiers indexés (totalité)")
-
-                # Mettre le bon message après affichage des fichiers
-                self.quick_search_zone.results_count_label.configure(
-                    text=f"Affichage de {len(all_files)} fichiers indexés",
-                    text_color="#1565C0"
-                )
-            else:
-                # Si aucun fichier récent, afficher message de prêt
-                self.quick_search_zone.results_count_label.configure(
-                    text="✅ Prêt à chercher",
-                    text_color="#28a745"
-                )
-
         # Afficher le workspace ACCUEIL au démarrage
         self.display_workspace("ACCUEIL")
 
@@ -3284,30 +3611,7 @@ class AppView(ctk.CTk):
         self.bind_events()
 
         # Forcer le dessin initial du dégradé après un court délai
-        self.after(100, self.draw_initial_gradient)
-
-    def draw_initial_gradient(self):
-        """Dessine le dégradé initial après que l'interface soit complètement chargée."""
-        try:
-            if hasattr(self, 'top_menu_view') and hasattr(self.top_menu_view, 'gradient_canvas'):
-                canvas = self.top_menu_view.gradient_canvas
-                
-                # Forcer la mise à jour de la géométrie
-                self.update_idletasks()
-                
-                height = canvas.winfo_height()
-                width = canvas.winfo_width()
-                
-                if height > 0 and width > 0:
-                    self.draw_gradient(
-                        canvas,
-                        height,
-                        self.model.gradient_color_start,
-                        self.model.gradient_color_end,
-                        prolong_ratio=self.model.gradient_prolong_ratio
-                    )
-        except Exception as e:
-            print(f"Erreur lors du dessin initial du dégradé: {e}")
+        self.after(100, self._paint_top_gradient)
 
     def create_main_workspace_frame(self):
         """Crée le cadre principal qui contiendra les différents espaces de travail."""
@@ -3315,100 +3619,159 @@ class AppView(ctk.CTk):
         self.main_workspace_frame.pack(side="left", fill="both", expand=True)
 
     def create_workspaces(self, parent):
-        """Crée les différents onglets/espaces de travail dans un dictionnaire."""
-        # Workspace ACCUEIL
-        workspace_accueil = ctk.CTkFrame(parent, fg_color="#F2F2F2", corner_radius=0)
-        self.home_view = HomeView(workspace_accueil, self.model, self.presenter)
+        """Prépare les espaces de travail : chacun n'est construit qu'à son premier affichage."""
+        self._workspace_builders = {
+            "ACCUEIL": self._build_workspace_accueil,
+            "DONNÉES BRUTES": self._build_workspace_raw_data,
+            "FILTRER": self._build_workspace_filtrer,
+            "OBSERVATIONS": self._build_workspace_observations,
+            "COTES": self._build_workspace_cotes,
+            "EXTRACTIONS": self._build_workspace_extractions,
+            "CALCULER": self._build_workspace_calculer,
+            "RECHERCHE RAPIDE": self._build_workspace_quick_search,
+            "PREFERENCES": self._build_workspace_preferences
+        }
+
+    def _get_workspace(self, workspace_name):
+        """Retourne le cadre du workspace, en le construisant au premier accès."""
+        workspace = self.workspaces.get(workspace_name)
+        if workspace is None:
+            builder = self._workspace_builders.get(workspace_name)
+            if builder is None:
+                return None
+            workspace = builder(self.main_workspace_frame)
+            # Tous les workspaces occupent la même zone : placés une fois pour
+            # toutes, l'affichage se fait ensuite par ordre d'empilement
+            workspace.place(x=0, y=0, relwidth=1, relheight=1)
+            # Construit sans être affiché (get_view) : rester sous le workspace
+            # courant ; display_workspace le remonte ensuite si besoin
+            workspace.lower()
+            self.workspaces[workspace_name] = workspace
+        return workspace
+
+    def get_view(self, view_name):
+        """Retourne la vue ``view_name`` en construisant son workspace si besoin."""
+        view = getattr(self, view_name, None)
+        if view is None:
+            workspace_name = self._VIEW_WORKSPACES.get(view_name)
+            if workspace_name is not None and self._get_workspace(workspace_name) is not None:
+                view = getattr(self, view_name, None)
+        return view
+
+    def _build_workspace_accueil(self, parent):
+        """Workspace ACCUEIL."""
+        workspace = ctk.CTkFrame(parent, fg_color="#F2F2F2", corner_radius=0)
+        self.home_view = HomeView(workspace, self.model, self.presenter)
         self.home_view.pack(fill="both", expand=True)
+        return workspace
 
-        # Workspace 1 - DONNÉES BRUTES
-        workspace1 = ctk.CTkFrame(parent, fg_color="#F2F2F2", corner_radius=0)
-        self.raw_data_view = RawDataWorkspaceView(workspace1, self.model, self.presenter)
+    def _build_workspace_raw_data(self, parent):
+        """Workspace DONNÉES BRUTES."""
+        workspace = ctk.CTkFrame(parent, fg_color="#F2F2F2", corner_radius=0)
+        self.raw_data_view = RawDataWorkspaceView(workspace, self.model, self.presenter)
         self.raw_data_view.pack(fill="both", expand=True)
-
-        # Workspace FILTRER (nettoyage des valeurs aberrantes)
-        workspace_filtrer = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
-        self.cleaning_view = CPTCleaningView(workspace_filtrer, self.model, self.presenter)
+        # Rattraper les données chargées avant la première ouverture de l'onglet
+        self.raw_data_view._refresh_display()
+        return workspace
+
+    def _build_workspace_filtrer(self, parent):
+        """Workspace FILTRER (nettoyage des valeurs aberrantes)."""
+        workspace = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
+        self.cleaning_view = CPTCleaningView(workspace, self.model, self.presenter)
         self.cleaning_view.pack(fill="both", expand=True)
+        self._workspace_hooks["FILTRER"] = self.cleaning_view
+        return workspace
 
-        # Workspace 2 : OBSERVATIONS
-        workspace2 = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
-        self.observations_view = ObservationsView(workspace2, self.model, self.presenter)
+    def _build_workspace_observations(self, parent):
+        """Workspace OBSERVATIONS."""
+        workspace = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
+        self.observations_view = ObservationsView(workspace, self.model, self.presenter)
         self.observations_view.pack(fill="both", expand=True)
+        self._workspace_hooks["OBSERVATIONS"] = self.observations_view
+        return workspace
 
-        # Workspace COTES
-        workspace_cotes = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
-        self.cotes_view = CotesView(workspace_cotes, self.model, self.presenter)
+    def _build_workspace_cotes(self, parent):
+        """Workspace COTES."""
+        workspace = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
+        self.cotes_view = CotesView(workspace, self.model, self.presenter)
         self.cotes_view.pack(fill="both", expand=True)
+        self._workspace_hooks["COTES"] = self.cotes_view
+        return workspace
 
-        # Workspace 3 : EXTRACTIONS
-        workspace3 = ctk.CTkFrame(parent, fg_color="white", corner_radius=0)
+    def _build_workspace_extractions(self, parent):
+        """Workspace EXTRACTIONS."""
+        return ctk.CTkFrame(parent, fg_color="white", corner_radius=0)
 
-        # Workspace 4 : TRAITER (vue de synthese des essais)
-        workspace4 = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
-        self.traiter_view = TraiterView(workspace4, self.model, self.presenter)
+    def _build_workspace_calculer(self, parent):
+        """Workspace CALCULER (vue de synthese des essais)."""
+        workspace = ctk.CTkFrame(parent, fg_color="#E8EDF2", corner_radius=0)
+        self.traiter_view = TraiterView(workspace, self.model, self.presenter)
         self.traiter_view.pack(fill="both", expand=True)
+        self._workspace_hooks["CALCULER"] = self.traiter_view
+        return workspace
+
+    def _build_workspace_quick_search(self, parent):
+        """Workspace RECHERCHE RAPIDE (avec l'interface de recherche)."""
+        workspace = ctk.CTkFrame(parent, fg_color="transparent", corner_radius=0)
+        self.quick_search_zone = FileSearchZoneView(workspace, self.model, self.presenter)
+
+        # L'indexation est déjà terminée au chargement de l'interface principale
+        self.quick_search_zone.indexing_completed = True
+
+        # Afficher l'intégralité des fichiers indexés
+        all_files = self.model.get_all_indexed_files()
+        if all_files:
+            self.quick_search_zone.display_search_results(all_files)
+            logger.debug("Affichage de %d fichiers indexés (totalité)", len(all_files))
+
+            # Mettre le bon message après affichage des fichiers
+            self.quick_search_zone.results_count_label.configure(
+                text=f"Affichage de {len(all_files)} fichiers indexés",
+                text_color="#1565C0"
+            )
+        else:
+            # Si aucun fichier récent, afficher message de prêt
+            self.quick_search_zone.results_count_label.configure(
+                text="✅ Prêt à chercher",
+                text_color="#28a745"
+            )
+        return workspace
 
-        # Workspace RECHERCHE RAPIDE (avec l'interface de recherche)
-        workspace_quick_search = ctk.CTkFrame(parent, fg_color="transparent", corner_radius=0)
-        self.quick_search_zone = FileSearchZoneView(workspace_quick_search, self.model, self.presenter)
-
-        # Workspace 5 : PREFERENCES (Réglages)
-        workspace5 = ctk.CTkFrame(parent, fg_color="#F2F2F2", corner_radius=0)
+    def _build_workspace_preferences(self, parent):
+        """Workspace PREFERENCES (Réglages)."""
+        workspace = ctk.CTkFrame(parent, fg_color="#F2F2F2", corner_radius=0)
         on_changed = self.presenter.on_settings_changed if self.presenter else None
         self.settings_view = SettingsView(
-            workspace5,
+            workspace,
             settings_manager=self.model.settings_manager,
             on_settings_changed=on_changed,
             model=self.model
         )
         self.settings_view.pack(fill="both", expand=True)
-
-        # Dictionnaire des workspaces
-        self.workspaces = {
-            "ACCUEIL": workspace_accueil,
-            "DONNÉES BRUTES": workspace1,
-            "FILTRER": workspace_filtrer,
-            "OBSERVATIONS": workspace2,
-            "COTES": workspace_cotes,
-            "EXTRACTIONS": workspace3,
-            "CALCULER": workspace4,
-            "RECHERCHE RAPIDE": workspace_quick_search,
-            "PREFERENCES": workspace5
-        }
+        return workspace
 
     def display_workspace(self, workspace_name):
         """Affiche l'espace de travail demandé, masque les autres."""
-        if hasattr(self, 'workspaces'):
-            # Notifier les vues quand on les quitte
-            if hasattr(self, 'cleaning_view'):
-                self.cleaning_view.on_workspace_hidden()
-            if hasattr(self, 'observations_view'):
-                self.observations_view.on_workspace_hidden()
-            if hasattr(self, 'cotes_view'):
-                self.cotes_view.on_workspace_hidden()
-            if hasattr(self, 'traiter_view'):
-                self.traiter_view.on_workspace_hidden()
-
-            for workspace in self.workspaces.values():
-                workspace.place_forget()
-            workspace = self.workspaces.get(workspace_name)
-            if workspace:
-                workspace.place(x=0, y=0, relwidth=1, relheight=1)
-
-            # Notifier les vues quand on y arrive
-            if workspace_name == "FILTRER" and hasattr(self, 'cleaning_view'):
-                self.cleaning_view.on_workspace_shown()
-            if workspace_name == "OBSERVATIONS" and hasattr(self, 'observations_view'):
-                self.observations_view.on_workspace_shown()
-            if workspace_name == "COTES" and hasattr(self, 'cotes_view'):
-                self.cotes_view.on_workspace_shown()
-            if workspace_name == "CALCULER" and hasattr(self, 'traiter_view'):
-                self.traiter_view.on_workspace_shown()
+        # Seule la vue du workspace affiché est à notifier
+        previous_hook = self._workspace_hooks.get(self._current_workspace_name)
+        if previous_hook is not None:
+            previous_hook.on_workspace_hidden()
+
+        # Passer le workspace au premier plan plutôt que de relancer le placer
+        workspace = self._get_workspace(workspace_name)
+        self._current_workspace = workspace
+        self._current_workspace_name = workspace_name
+        if workspace:
+            workspace.tkraise()
+
+        # Notifier la vue quand on y arrive
+        hook = self._workspace_hooks.get(workspace_name)
+        if hook is not None:
+            hook.on_workspace_shown()
 
     def focus_search_entry(self):
         """Met le focus sur le champ de recherche."""
-        if hasattr(self, 'quick_search_zone'):
+        if self.quick_search_zone is not None:
             self.quick_search_zone.focus_search_entry()
 
     def bind_events(self):
@@ -3418,48 +3781,52 @@ class AppView(ctk.CTk):
     def on_resize(self, event):
         """Au redimensionnement, on redessine le dégradé de la barre de menu."""
         # Ne rien faire si l'application se ferme
-        if getattr(self, '_closing', False):
+        if self._closing:
             return
 
         # Ignorer les événements qui ne concernent pas la fenêtre principale
         if event.widget != self:
             return
 
-        # Délai court pour s'assurer que les dimensions sont à jour
-        self.after(10, self._redraw_gradient_delayed)
+        # Un simple déplacement de la fenêtre ne change pas le dégradé
+        size = (event.width, event.height)
+        if size == self._last_window_size:
+            return
+        self._last_window_size = size
 
-    def _redraw_gradient_delayed(self):
-        """Redessine le dégradé avec un délai pour s'assurer des bonnes dimensions."""
-        try:
-            # Vérifications d'existence
-            if not hasattr(self, 'top_menu_view'):
-                return
+        # Debounce : pendant un redimensionnement à la souris, seul le dernier
+        # événement déclenche réellement le redessin
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(50, self._redraw_gradient_delayed)
 
-            top_menu = self.top_menu_view
-            if not hasattr(top_menu, 'gradient_canvas'):
-                return
+    def _redraw_gradient_delayed(self):
+        """Redessin différé déclenché par on_resize (debounce)."""
+        self._resize_after_id = None
+        self._paint_top_gradient(retry=False)
 
-            canvas = top_menu.gradient_canvas
+    def _paint_top_gradient(self, retry=True):
+        """Dessine le dégradé de la barre de menu avec les couleurs du modèle."""
+        if self.top_menu_view is None or self._closing:
+            return
+        try:
+            canvas = self.top_menu_view.gradient_canvas
 
             # Vérifier si le widget existe encore dans Tkinter
             if not canvas.winfo_exists():
                 return
 
-            # Forcer la mise à jour de la géométrie
-            self.update_idletasks()
+            # Dimensions déjà à jour après le <Configure> qui a déclenché ce dessin
+            height = canvas.winfo_height()
+            width = canvas.winfo_width()
 
-            # Obtenir les dimensions de manière sécurisée
-            try:
-                height = canvas.winfo_height()
-                width = canvas.winfo_width()
-            except tk.TclError:
-                return
-
-            # Vérifier des dimensions valides
-            if height <= 0 or width <= 0:
+            # Géométrie pas encore calculée : on réessaie une fois au
+            # prochain passage idle (on_resize prendra le relais ensuite)
+            if height <= 1 or width <= 1:
+                if retry:
+                    self.after_idle(lambda: self._paint_top_gradient(retry=False))
                 return
 
-            # Redessiner le dégradé
             self.draw_gradient(
                 canvas,
                 height,
@@ -3477,29 +3844,104 @@ class AppView(ctk.CTk):
         width = canvas.winfo_width()
         if width <= 0 or height <= 0:
             return
-        # On ne génère l'image que si la taille a changé
-        if not self.gradient_image or self.gradient_image.size != (width, height):
-            gradient_image = Image.new("RGB", (width, height), color1)
-            draw = ImageDraw.Draw(gradient_image)
-            prolong_steps = int(prolong_ratio * width)
-            for x in range(prolong_steps, width):
-                ratio = (x - prolong_steps) / (width - prolong_steps)
-                color = self.interpolate_color(color1, color2, ratio)
-                draw.line([(x, 0), (x, height)], fill=color)
-            self.gradient_image = gradient_image
-            self.gradient_tk_image = ImageTk.PhotoImage(gradient_image)
-        canvas.create_image(0, 0, anchor="nw", image=self.gradient_tk_image)
-
-    def interpolate_color(self, color1, color2, ratio):
-        """Interpole entre deux couleurs hexadécimales selon un ratio donné."""
-        r1, g1, b1 = self.hex_to_rgb(color1)
-        r2, g2, b2 = self.hex_to_rgb(color2)
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def hex_to_rgb(self, hex_color):
-        """Convertit une couleur hexadécimale en tuple RGB."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # Rien à faire si le dégradé affiché correspond déjà aux paramètres
+        cache_key = (width, height, color1, color2, prolong_ratio)
+        if cache_key == self._gradient_cache_key and self.gradient_tk_image is not None:
+            if self._gradient_canvas_item is None:
+                self._show_gradient(canvas)
+            return
+        # Variation de largeur de quelques pixels : imperceptible, on garde
+        # l'image actuelle (le fond du canvas prolonge la couleur de fin)
+        if self._gradient_cache_key is not None and self._gradient_canvas_item is not None:
+            last_width = self._gradient_cache_key[0]
+            if abs(width - last_width) < 4 and self._gradient_cache_key[1:] == cache_key[1:]:
+                return
+        # Dégradé déjà généré pour cette taille (ex. retour après maximisation)
+        cached_image = self._gradient_images.get(cache_key)
+        if cached_image is not None:
+            self._gradient_images.move_to_end(cache_key)
+            self._gradient_pending_key = None  # Un résultat en cours serait périmé
+            self._install_gradient(canvas, cache_key, cached_image)
+            return
+        # Déjà en cours de génération
+        if cache_key == self._gradient_pending_key:
+            return
+        # L'image est générée dans un thread ; l'ancien dégradé reste affiché
+        # en attendant, ce qui évite de figer l'interface pendant un resize
+        self._gradient_pending_key = cache_key
+        future = self._gradient_executor.submit(
+            self._build_gradient_image, width, height, color1, color2, prolong_ratio
+        )
+        future.add_done_callback(
+            lambda f: self._on_gradient_built(f, canvas, cache_key)
+        )
+
+    def _build_gradient_image(self, width, height, color1, color2, prolong_ratio):
+        """Construit l'image PIL du dégradé (appelée hors du thread Tk)."""
+        # Interpolation vectorisée : une ligne de pixels calculée d'un bloc,
+        # puis répétée sur toute la hauteur
+        c1 = np.array(_hex_to_rgb(color1), dtype=np.float32)
+        c2 = np.array(_hex_to_rgb(color2), dtype=np.float32)
+        prolong_steps = int(prolong_ratio * width)
+        ratios = np.clip(
+            (np.arange(width) - prolong_steps) / max(width - prolong_steps, 1), 0, 1
+        ).astype(np.float32)
+        row = (c1 + (c2 - c1) * ratios[:, None]).astype(np.uint8)
+        img_array = np.broadcast_to(row, (height, width, 3)).copy()
+        return Image.fromarray(img_array, "RGB")
+
+    def _on_gradient_built(self, future, canvas, cache_key):
+        """Callback du worker : repasse le résultat au thread Tk."""
+        if self._closing:
+            return
+        try:
+            if future.cancelled():
+                self.after(0, self._clear_gradient_pending, cache_key)
+                return
+            try:
+                gradient_image = future.result()
+            except Exception:
+                logger.exception("Erreur lors de la génération du dégradé")
+                # Libérer la clé pour qu'un prochain redessin relance la génération
+                self.after(0, self._clear_gradient_pending, cache_key)
+                return
+            self.after(0, self._apply_gradient, canvas, cache_key, gradient_image)
+        except (RuntimeError, tk.TclError):
+            # Boucle Tk arrêtée pendant la génération
+            pass
+
+    def _clear_gradient_pending(self, cache_key):
+        """Oublie une génération de dégradé abandonnée (thread Tk)."""
+        if self._gradient_pending_key == cache_key:
+            self._gradient_pending_key = None
+
+    def _apply_gradient(self, canvas, cache_key, gradient_image):
+        """Installe sur le canvas le dégradé généré (thread Tk)."""
+        # Ignorer un résultat périmé : une taille plus récente a été demandée
+        if cache_key != self._gradient_pending_key or self._closing:
+            return
+        self._gradient_pending_key = None
+        if not canvas.winfo_exists():
+            return
+        # PhotoImage doit être créée dans le thread Tk
+        self.gradient_image = gradient_image
+        tk_image = ImageTk.PhotoImage(gradient_image)
+        self._gradient_images[cache_key] = tk_image
+        while len(self._gradient_images) > self._GRADIENT_CACHE_SIZE:
+            self._gradient_images.popitem(last=False)
+        self._install_gradient(canvas, cache_key, tk_image)
+
+    def _install_gradient(self, canvas, cache_key, tk_image):
+        """Fait de ``tk_image`` le dégradé courant et l'affiche."""
+        self.gradient_tk_image = tk_image
+        self._gradient_cache_key = cache_key
+        canvas.configure(bg=cache_key[3])
+        self._show_gradient(canvas)
+
+    def _show_gradient(self, canvas):
+        """Affiche l'image de dégradé courante sur le canvas."""
+        # Un seul item image sur le canvas : on le met à jour plutôt que d'en empiler
+        if self._gradient_canvas_item is not None and canvas.type(self._gradient_canvas_item):
+            canvas.itemconfigure(self._gradient_canvas_item, image=self.gradient_tk_image)
+        else:
+            self._gradient_canvas_item = canvas.create_image(0, 0, anchor="nw", image=self.gradient_tk_image)